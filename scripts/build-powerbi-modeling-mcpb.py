@@ -8,15 +8,26 @@ This script:
 3. Extracts and repackages as .mcpb for Claude Desktop
 """
 
+import functools
 import gzip
+import io
 import json
 import os
 import shutil
-import tempfile
+import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Configuration
 EXTENSION_ID = "analysis-services.powerbi-modeling-mcp"
@@ -26,6 +37,19 @@ OUTPUT_DIR = Path("claude-desktop")
 OUTPUT_FILE = OUTPUT_DIR / "powerbi-modeling-mcp.mcpb"
 VERSION_FILE = Path(".github/.powerbi-modeling-mcp-version")
 
+# Returned by download_vsix when the server confirms the VSIX is unchanged (HTTP 304)
+NOT_MODIFIED = object()
+
+# Location of the MCP server files inside the VSIX
+SERVER_PREFIX = "extension/server/"
+
+# Members whose VSIX compression saved less than this fraction are already
+# compressed (e.g. the packed server .exe); store them instead of re-deflating
+MIN_DEFLATE_SAVING = 0.2
+
+# Unix mode for bundle files with none of their own (rw-r--r--, as extracted files had)
+DEFAULT_FILE_ATTR = 0o644 << 16
+
 # VS Marketplace API
 MARKETPLACE_API = "https://marketplace.visualstudio.com/_apis/public/gallery/extensionquery"
 VSIX_URL_TEMPLATE = "https://marketplace.visualstudio.com/_apis/public/gallery/publishers/{publisher}/vsextensions/{name}/{version}/vspackage"
@@ -47,7 +71,17 @@ PLATFORMS = {
     # },
 }
 
+# Shared session so marketplace calls reuse pooled keep-alive connections
+SESSION = requests.Session()
+SESSION.headers.update({"User-Agent": "powerbi-modeling-mcp-builder/1"})
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504)),
+))
+
 
+@functools.lru_cache(maxsize=1)
 def get_latest_version() -> str:
     """Query VS Marketplace for the latest extension version."""
     payload = {
@@ -59,7 +93,7 @@ def get_latest_version() -> str:
         "Accept": "application/json;api-version=3.0-preview.1",
     }
 
-    response = requests.post(MARKETPLACE_API, json=payload, headers=headers)
+    response = SESSION.post(MARKETPLACE_API, json=payload, headers=headers)
     response.raise_for_status()
 
     data = response.json()
@@ -67,6 +101,7 @@ def get_latest_version() -> str:
     return version
 
 
+@functools.lru_cache(maxsize=1)
 def get_current_version() -> str | None:
     """Read the currently installed version from version file."""
     if VERSION_FILE.exists():
@@ -74,15 +109,39 @@ def get_current_version() -> str | None:
     return None
 
 
-def download_vsix(version: str, platform: str, platform_config: dict) -> Path | None:
-    """Download VSIX for a specific platform."""
+def etag_file(platform: str) -> Path:
+    """Path of the file recording the VSIX ETag last built for a platform."""
+    return VERSION_FILE.with_name(f".powerbi-modeling-mcp-etag-{platform}")
+
+
+def read_etag(platform: str) -> str | None:
+    """Read the ETag of the VSIX the existing bundle was built from, if any."""
+    path = etag_file(platform)
+    if OUTPUT_FILE.exists() and path.exists():
+        return path.read_text().strip() or None
+    return None
+
+
+def download_vsix(version: str, platform: str, platform_config: dict, etag: str | None = None):
+    """
+    Download VSIX for a specific platform into memory.
+
+    Returns (vsix, etag), NOT_MODIFIED if `etag` still matches (HTTP 304),
+    or None if the platform is not available.
+    """
     url = VSIX_URL_TEMPLATE.format(
         publisher=PUBLISHER, name=EXTENSION_NAME, version=version
     )
     url += platform_config["url_param"]
 
     print(f"Downloading {platform} VSIX from {url}")
-    response = requests.get(url, stream=True)
+    headers = {"If-None-Match": etag} if etag else None
+    response = SESSION.get(url, stream=True, headers=headers)
+
+    if response.status_code == 304:
+        print(f"  Platform {platform} unchanged since last build")
+        response.close()
+        return NOT_MODIFIED
 
     # Check if platform is supported
     if response.status_code == 404:
@@ -98,38 +157,50 @@ def download_vsix(version: str, platform: str, platform_config: dict) -> Path |
 
     response.raise_for_status()
 
-    # Save to temp file
-    temp_path = Path(tempfile.mktemp(suffix=".vsix.gz"))
-    with open(temp_path, "wb") as f:
-        for chunk in response.iter_content(chunk_size=8192):
-            f.write(chunk)
+    # VSIX packages are a few tens of MB, so buffer in memory rather than on disk
+    vsix = io.BytesIO()
+    for chunk in response.iter_content(chunk_size=1 << 20):
+        vsix.write(chunk)
+    vsix.seek(0)
 
-    return temp_path
+    return vsix, response.headers.get("etag")
 
 
-def extract_vsix(vsix_path: Path, output_dir: Path) -> Path:
-    """Extract VSIX to directory (handles both gzipped and plain zip)."""
-    # Check if gzipped by reading magic bytes
-    with open(vsix_path, "rb") as f:
-        magic = f.read(2)
+def open_vsix(vsix: io.BytesIO) -> zipfile.ZipFile:
+    """Open a downloaded VSIX as a zip (handles both gzipped and plain zip)."""
+    # Check if gzipped by peeking at the magic bytes
+    magic = vsix.read(2)
+    vsix.seek(0)
 
     if magic == b'\x1f\x8b':  # Gzip magic bytes
-        # Decompress gzip first
-        decompressed_path = vsix_path.with_suffix(".vsix")
-        with gzip.open(vsix_path, "rb") as f_in:
-            with open(decompressed_path, "wb") as f_out:
-                shutil.copyfileobj(f_in, f_out)
-        vsix_path.unlink()
-        vsix_path = decompressed_path
+        with gzip.GzipFile(fileobj=vsix) as f_in:
+            vsix = io.BytesIO(f_in.read())
+
+    return zipfile.ZipFile(vsix, "r")
 
-    # Extract zip
-    with zipfile.ZipFile(vsix_path, "r") as z:
-        z.extractall(output_dir)
 
-    # Cleanup
-    vsix_path.unlink()
+def server_members(vsix_zip: zipfile.ZipFile) -> list[zipfile.ZipInfo]:
+    """List the server file entries in a VSIX."""
+    return [
+        info for info in vsix_zip.infolist()
+        if info.filename.startswith(SERVER_PREFIX) and not info.is_dir()
+    ]
 
-    return output_dir
+
+def member_compress_type(info: zipfile.ZipInfo) -> int:
+    """Pick ZIP_STORED for members that barely compressed in the VSIX, else ZIP_DEFLATED."""
+    if info.compress_type == zipfile.ZIP_STORED or not info.file_size:
+        return zipfile.ZIP_STORED
+    if info.compress_size > info.file_size * (1 - MIN_DEFLATE_SAVING):
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+def _dumps(obj) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
 
 
 def create_manifest(version: str, platforms: list[str]) -> dict:
@@ -179,72 +250,112 @@ def create_manifest(version: str, platforms: list[str]) -> dict:
     }
 
 
-def build_mcpb(version: str) -> bool:
-    """Build the mcpb bundle."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        bundle_dir = temp_path / "bundle"
-        bundle_dir.mkdir()
-
-        available_platforms = []
-
-        for platform, config in PLATFORMS.items():
-            print(f"\nProcessing {platform}...")
-
-            # Download VSIX
-            vsix_path = download_vsix(version, platform, config)
-            if vsix_path is None:
-                continue
-
-            # Extract VSIX
-            extract_dir = temp_path / f"extract-{platform}"
-            extract_vsix(vsix_path, extract_dir)
-
-            # Copy server files
-            server_src = extract_dir / "extension" / "server"
-            server_dst = bundle_dir / "server"
-
-            if server_src.exists():
-                if server_dst.exists():
-                    # Merge server directories for multi-platform
-                    for item in server_src.iterdir():
-                        dst_item = server_dst / item.name
-                        if not dst_item.exists():
-                            if item.is_dir():
-                                shutil.copytree(item, dst_item)
-                            else:
-                                shutil.copy2(item, dst_item)
-                else:
-                    shutil.copytree(server_src, server_dst)
-
-                available_platforms.append(platform)
-                print(f"  Added {platform} server files")
-
-        if not available_platforms:
-            print("ERROR: No platforms available")
-            return False
-
-        # Create manifest
-        manifest = create_manifest(version, available_platforms)
-        manifest_path = bundle_dir / "manifest.json"
-        with open(manifest_path, "w") as f:
-            json.dump(manifest, f, indent=2)
-        print(f"\nCreated manifest.json")
+def fetch_server_members(version: str, platform: str, platform_config: dict, etag: str | None = None):
+    """
+    Download a platform's VSIX and list its server files.
 
-        # Package as mcpb (zip)
-        OUTPUT_DIR.mkdir(exist_ok=True)
-        with zipfile.ZipFile(OUTPUT_FILE, "w", zipfile.ZIP_DEFLATED) as z:
-            for file_path in bundle_dir.rglob("*"):
-                if file_path.is_file():
-                    arcname = file_path.relative_to(bundle_dir)
-                    z.write(file_path, arcname)
+    Returns (vsix_zip, members, etag), NOT_MODIFIED, or None if unavailable.
+    """
+    downloaded = download_vsix(version, platform, platform_config, etag)
+    if downloaded is None or downloaded is NOT_MODIFIED:
+        return downloaded
 
-        print(f"\nCreated {OUTPUT_FILE}")
+    vsix, new_etag = downloaded
+    vsix_zip = open_vsix(vsix)
+    members = server_members(vsix_zip)
+    if not members:
+        vsix_zip.close()
+        return None
+    return vsix_zip, members, new_etag
+
+
+def _copy_server_members(out_zip: zipfile.ZipFile, vsix_zip: zipfile.ZipFile,
+                         members: list[zipfile.ZipInfo], seen: set[str]) -> None:
+    """Stream VSIX server members into the bundle under server/, skipping arcnames in seen."""
+    for info in members:
+        arcname = "server/" + info.filename[len(SERVER_PREFIX):]
+        if arcname in seen:
+            continue
+        seen.add(arcname)
+        dst_info = zipfile.ZipInfo(arcname, date_time=info.date_time)
+        dst_info.compress_type = member_compress_type(info)
+        dst_info.file_size = info.file_size
+        # Keep the VSIX's Unix mode (including exec bits) rather than ZipFile.open's 0o600 default
+        dst_info.external_attr = info.external_attr if info.external_attr >> 16 else DEFAULT_FILE_ATTR
+        with vsix_zip.open(info) as src, out_zip.open(dst_info, "w") as dst:
+            shutil.copyfileobj(src, dst, 1 << 20)
+
+
+def build_mcpb(version: str) -> bool | None:
+    """
+    Build the mcpb bundle, writing server files straight from the VSIX into the output zip.
+
+    Returns True on success, False on failure, or None if every available
+    platform's VSIX is unchanged since the last build and the bundle was kept.
+    """
+    print(f"\nProcessing {', '.join(PLATFORMS)}...")
+
+    # The stored ETags describe the existing bundle, so they only apply when
+    # rebuilding that same version; a new version must always be built
+    same_version = version == get_current_version()
+
+    # Downloads are independent network I/O, so fetch all platforms at once
+    with ThreadPoolExecutor(max_workers=max(1, len(PLATFORMS))) as executor:
+        futures = {
+            platform: executor.submit(fetch_server_members, version, platform, config,
+                                      read_etag(platform) if same_version else None)
+            for platform, config in PLATFORMS.items()
+        }
+    results = {platform: future.result() for platform, future in futures.items()}
+
+    unchanged = [platform for platform, fetched in results.items() if fetched is NOT_MODIFIED]
+    if unchanged and all(fetched is NOT_MODIFIED for fetched in results.values() if fetched is not None):
+        return None
 
-        # Update version file
-        VERSION_FILE.write_text(version)
+    # Something changed, so the bundle is rebuilt and needs the unchanged platforms too
+    for platform in unchanged:
+        results[platform] = fetch_server_members(version, platform, PLATFORMS[platform])
+
+    # Merge in PLATFORMS order so the bundle does not depend on download timing
+    sources = []
+    for platform, fetched in results.items():
+        if fetched is not None:
+            sources.append((platform, *fetched))
+
+    if not sources:
+        print("ERROR: No platforms available")
+        return False
+
+    available_platforms = [platform for platform, _, _, _ in sources]
+    manifest = create_manifest(version, available_platforms)
+
+    # Package as mcpb (zip); the first platform providing a file wins when merging
+    OUTPUT_DIR.mkdir(exist_ok=True)
+    seen = set()
+    with zipfile.ZipFile(OUTPUT_FILE, "w", zipfile.ZIP_DEFLATED) as out:
+        for platform, vsix_zip, members, _ in sources:
+            _copy_server_members(out, vsix_zip, members, seen)
+            vsix_zip.close()
+            print(f"  Added {platform} server files")
+
+        manifest_info = zipfile.ZipInfo("manifest.json", date_time=time.localtime()[:6])
+        manifest_info.compress_type = zipfile.ZIP_DEFLATED
+        manifest_info.external_attr = DEFAULT_FILE_ATTR
+        out.writestr(manifest_info, _dumps(manifest))
+        print(f"\nCreated manifest.json")
 
-        return True
+    print(f"\nCreated {OUTPUT_FILE}")
+
+    # Update version file and the ETags the bundle was built from
+    VERSION_FILE.write_text(version)
+    get_current_version.cache_clear()
+    for platform, _, _, etag in sources:
+        if etag:
+            etag_file(platform).write_text(etag)
+        else:
+            etag_file(platform).unlink(missing_ok=True)
+
+    return True
 
 
 def set_output(name: str, value: str):
@@ -261,8 +372,12 @@ def main():
     print("Power BI Modeling MCP Bundle Builder")
     print("=" * 60)
 
-    # Check latest version
+    force_update = os.environ.get("FORCE_UPDATE", "false").lower() == "true"
+
+    # Check latest version (a forced update never trusts a cached answer)
     print("\nChecking VS Marketplace for latest version...")
+    if force_update:
+        get_latest_version.cache_clear()
     latest_version = get_latest_version()
     print(f"Latest version: {latest_version}")
 
@@ -271,7 +386,6 @@ def main():
     print(f"Current version: {current_version or 'None'}")
 
     # Check if update needed
-    force_update = os.environ.get("FORCE_UPDATE", "false").lower() == "true"
     if current_version == latest_version and not force_update:
         print("\nAlready up to date!")
         set_output("updated", "false")
@@ -282,7 +396,10 @@ def main():
     # Build mcpb
     success = build_mcpb(latest_version)
 
-    if success:
+    if success is None:
+        print("\nVSIX unchanged since last build, keeping existing bundle")
+        set_output("updated", "false")
+    elif success:
         print("\n" + "=" * 60)
         print(f"Successfully built mcpb for version {latest_version}")
         print("=" * 60)
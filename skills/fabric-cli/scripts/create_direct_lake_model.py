@@ -4,26 +4,104 @@ Create a Direct Lake semantic model from lakehouse tables.
 
 Usage:
     python3 create_direct_lake_model.py "src.Workspace/LH.Lakehouse" "dest.Workspace/Model.SemanticModel" -t schema.table
+    python3 create_direct_lake_model.py "src.Workspace/LH.Lakehouse" "dest.Workspace/Model.SemanticModel" -t gold.orders gold.customers
 
 Requirements:
     - fab CLI installed and authenticated
 """
 
 import argparse
+import functools
+import hashlib
+import io
 import json
+import os
+import re
 import subprocess
 import sys
-import uuid
 import tempfile
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-
-def run_fab(args: list[str]) -> str:
-    """Run fab command and return output."""
+# Upper bound on concurrent fab processes
+MAX_FAB_WORKERS = 8
+
+# Digest of the inputs behind the last successful import, per destination model
+CACHE_DIR = Path.home() / ".cache" / "fabric-cli-plugin" / "dlm"
+
+# One `fab table schema` data row: column name, then the (possibly multi-word) type
+_SCHEMA_ROW = re.compile(r'^\s*(\S+)\s+(.+?)\s*$')
+
+# SQL type substring -> TMDL data type, checked in priority order (first match wins)
+_TYPE_RULES = (
+    (("int",), "int64"),
+    (("float", "double", "decimal"), "double"),
+    (("bool", "bit"), "boolean"),
+    (("date", "time"), "dateTime"),
+)
+
+# table.tmdl building blocks, formatted once per table / column
+_HEADER_TEMPLATE = (
+    "table '{table}'\n"
+    "\tlineageTag: {lineage_tag}\n"
+    "\tsourceLineageTag: [{schema}].[{table}]\n"
+    "\n"
+)
+_COL_TEMPLATE = (
+    "\tcolumn '{name}'\n"
+    "\t\tdataType: {data_type}\n"
+    "\t\tlineageTag: {lineage_tag}\n"
+    "\t\tsourceLineageTag: {name}\n"
+    "\t\tsummarizeBy: none\n"
+    "\t\tsourceColumn: {name}\n"
+    "\n"
+    "\t\tannotation SummarizationSetBy = Automatic\n"
+    "\n"
+)
+_PARTITION_TEMPLATE = (
+    "\tpartition '{table}' = entity\n"
+    "\t\tmode: directLake\n"
+    "\t\tsource\n"
+    "\t\t\tentityName: {table}\n"
+    "\t\t\tschemaName: {schema}\n"
+    "\t\t\texpressionSource: DatabaseQuery\n"
+)
+
+# definition.pbism never varies, so serialize it once
+_PBISM_STR = json.dumps({
+    "$schema": "https://developer.microsoft.com/json-schemas/fabric/item/semanticModel/definitionProperties/1.0.0/schema.json",
+    "version": "4.0",
+    "settings": {}
+}, indent=2)
+
+# .platform as json.dumps(..., indent=2) would emit it; values are JSON-encoded by the caller
+_PLATFORM_TEMPLATE = (
+    '{\n'
+    '  "$schema": "https://developer.microsoft.com/json-schemas/fabric/gitIntegration/platformProperties/2.0.0/schema.json",\n'
+    '  "metadata": {\n'
+    '    "type": "SemanticModel",\n'
+    '    "displayName": %(display_name)s\n'
+    '  },\n'
+    '  "config": {\n'
+    '    "version": "2.0",\n'
+    '    "logicalId": %(logical_id)s\n'
+    '  }\n'
+    '}'
+)
+
+
+def _run_fab(args: list[str]) -> subprocess.CompletedProcess:
+    """Run fab command and return the completed process."""
     result = subprocess.run(["fab"] + args, capture_output=True, text=True)
     if result.returncode != 0:
         print(f"fab error: {result.stderr}", file=sys.stderr)
-    return result.stdout.strip()
+    return result
+
+
+def run_fab(args: list[str]) -> str:
+    """Run fab command and return output."""
+    return _run_fab(args).stdout.strip()
 
 
 def get_lakehouse_sql_endpoint(workspace: str, lakehouse: str) -> dict:
@@ -33,7 +111,21 @@ def get_lakehouse_sql_endpoint(workspace: str, lakehouse: str) -> dict:
     return json.loads(output)
 
 
-def get_table_schema(workspace: str, lakehouse: str, schema: str, table: str) -> list:
+def get_table_schemas(workspace: str, lakehouse: str, tables: list[tuple[str, str]],
+                      executor: ThreadPoolExecutor | None = None) -> dict[tuple[str, str], list]:
+    """Get schemas for several (schema, table) pairs, querying fab concurrently."""
+    if executor is None:
+        with ThreadPoolExecutor(max_workers=min(MAX_FAB_WORKERS, len(tables) or 1)) as own_executor:
+            return get_table_schemas(workspace, lakehouse, tables, own_executor)
+
+    futures = {
+        key: executor.submit(_get_table_schema, workspace, lakehouse, *key)
+        for key in tables
+    }
+    return {key: future.result() for key, future in futures.items()}
+
+
+def _get_table_schema(workspace: str, lakehouse: str, schema: str, table: str) -> list:
     """Get table schema from lakehouse (parses text output)."""
     path = f"{workspace}/{lakehouse}/Tables/{schema}/{table}"
     output = run_fab(["table", "schema", path])
@@ -50,35 +142,31 @@ def get_table_schema(workspace: str, lakehouse: str, schema: str, table: str) ->
             in_data = True
             continue
         if in_data and line:
-            parts = line.split()
-            if len(parts) >= 2:
-                columns.append({"name": parts[0], "type": parts[1]})
+            m = _SCHEMA_ROW.match(line)
+            if m:
+                columns.append({"name": m.group(1), "type": m.group(2)})
     return columns
 
 
+@functools.lru_cache(maxsize=256)
 def tmdl_data_type(sql_type: str) -> str:
     """Convert SQL type to TMDL data type."""
     sql_type = sql_type.lower()
-    if 'int' in sql_type:
-        return 'int64'
-    elif 'float' in sql_type or 'double' in sql_type or 'decimal' in sql_type:
-        return 'double'
-    elif 'bool' in sql_type or 'bit' in sql_type:
-        return 'boolean'
-    elif 'date' in sql_type or 'time' in sql_type:
-        return 'dateTime'
-    else:
-        return 'string'
-
-
-def create_model_tmdl(model_name: str, table_name: str) -> str:
+    for substrings, data_type in _TYPE_RULES:
+        for substring in substrings:
+            if substring in sql_type:
+                return data_type
+    return 'string'
+
+
+def create_model_tmdl(model_name: str, table_names: list[str]) -> str:
     """Create model.tmdl content."""
+    table_refs = "".join(f"ref table '{table_name}'\n" for table_name in table_names)
     return f"""model '{model_name}'
 \tculture: en-US
 \tdefaultPowerBIDataSourceVersion: powerBI_V3
 
-ref table '{table_name}'
-"""
+{table_refs}"""
 
 
 def create_expressions_tmdl(connection_string: str, endpoint_id: str) -> str:
@@ -88,84 +176,96 @@ def create_expressions_tmdl(connection_string: str, endpoint_id: str) -> str:
 \t\t\tdatabase = Sql.Database("{connection_string}", "{endpoint_id}")
 \t\tin
 \t\t\tdatabase
-\tlineageTag: {uuid.uuid4()}
+\tlineageTag: {_fast_uuid4()}
 """
 
 
+def _uuid_batch(n: int) -> list[str]:
+    """Generate n random (version 4) UUID strings from a single urandom call."""
+    raw = bytearray(os.urandom(16 * n))
+    for i in range(0, 16 * n, 16):
+        raw[i + 6] = (raw[i + 6] & 0x0F) | 0x40  # version 4
+        raw[i + 8] = (raw[i + 8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = raw.hex()
+    return [
+        f"{h[i:i + 8]}-{h[i + 8:i + 12]}-{h[i + 12:i + 16]}-{h[i + 16:i + 20]}-{h[i + 20:i + 32]}"
+        for i in range(0, 32 * n, 32)
+    ]
+
+
+def _fast_uuid4() -> str:
+    """Generate one random (version 4) UUID string."""
+    return _uuid_batch(1)[0]
+
+
 def create_table_tmdl(table_name: str, schema_name: str, columns: list) -> str:
     """Create table.tmdl content."""
-    lines = [
-        f"table '{table_name}'",
-        f"\tlineageTag: {uuid.uuid4()}",
-        f"\tsourceLineageTag: [{schema_name}].[{table_name}]",
-        ""
-    ]
+    tags = _uuid_batch(len(columns) + 1)
+    buf = io.StringIO()
+    buf.write(_HEADER_TEMPLATE.format(table=table_name, schema=schema_name, lineage_tag=tags.pop()))
 
-    # Add columns
     for col in columns:
-        col_name = col['name']
-        data_type = tmdl_data_type(col['type'])
-        lines.extend([
-            f"\tcolumn '{col_name}'",
-            f"\t\tdataType: {data_type}",
-            f"\t\tlineageTag: {uuid.uuid4()}",
-            f"\t\tsourceLineageTag: {col_name}",
-            f"\t\tsummarizeBy: none",
-            f"\t\tsourceColumn: {col_name}",
-            "",
-            f"\t\tannotation SummarizationSetBy = Automatic",
-            ""
-        ])
-
-    # Add partition
-    lines.extend([
-        f"\tpartition '{table_name}' = entity",
-        f"\t\tmode: directLake",
-        f"\t\tsource",
-        f"\t\t\tentityName: {table_name}",
-        f"\t\t\tschemaName: {schema_name}",
-        f"\t\t\texpressionSource: DatabaseQuery",
-        ""
-    ])
-
-    return "\n".join(lines)
+        buf.write(_COL_TEMPLATE.format(
+            name=col['name'],
+            data_type=tmdl_data_type(col['type']),
+            lineage_tag=tags.pop(),
+        ))
+
+    buf.write(_PARTITION_TEMPLATE.format(table=table_name, schema=schema_name))
+    return buf.getvalue()
 
 
 def create_database_tmdl() -> str:
     """Create database.tmdl content."""
-    return f"""database '{uuid.uuid4()}'
+    return f"""database '{_fast_uuid4()}'
 """
 
 
 def create_pbism() -> str:
     """Create definition.pbism content."""
-    return json.dumps({
-        "$schema": "https://developer.microsoft.com/json-schemas/fabric/item/semanticModel/definitionProperties/1.0.0/schema.json",
-        "version": "4.0",
-        "settings": {}
-    }, indent=2)
+    return _PBISM_STR
 
 
 def create_platform(model_name: str) -> str:
     """Create .platform content."""
-    return json.dumps({
-        "$schema": "https://developer.microsoft.com/json-schemas/fabric/gitIntegration/platformProperties/2.0.0/schema.json",
-        "metadata": {
-            "type": "SemanticModel",
-            "displayName": model_name
-        },
-        "config": {
-            "version": "2.0",
-            "logicalId": str(uuid.uuid4())
-        }
-    }, indent=2)
+    return _PLATFORM_TEMPLATE % {
+        "display_name": json.dumps(model_name),
+        "logical_id": json.dumps(_fast_uuid4()),
+    }
+
+
+def model_digest(dest_path: str, endpoint: dict, schemas: dict[tuple[str, str], list]) -> str:
+    """Hash everything the generated TMDL depends on, other than its random lineage tags."""
+    h = hashlib.sha256(Path(__file__).read_bytes())
+    h.update(json.dumps([
+        dest_path,
+        endpoint["connectionString"],
+        endpoint["id"],
+        [[schema_name, table_name, columns] for (schema_name, table_name), columns in schemas.items()],
+    ]).encode())
+    return h.hexdigest()
+
+
+def _walk_files(root) -> Iterator[str]:
+    """Yield paths of regular files under root, using scandir's cached entry types."""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_files(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                yield entry.path
 
 
 def main():
     parser = argparse.ArgumentParser(description="Create Direct Lake semantic model")
     parser.add_argument("source", help="Source: Workspace.Workspace/Lakehouse.Lakehouse")
     parser.add_argument("dest", help="Destination: Workspace.Workspace/Model.SemanticModel")
-    parser.add_argument("-t", "--table", required=True, help="Table: schema.table_name")
+    parser.add_argument("-t", "--table", required=True, nargs="+", dest="tables",
+                        help="Table(s): schema.table_name [schema.table_name ...]")
+    parser.add_argument("--verbose", action="store_true",
+                        help="List the generated TMDL files")
+    parser.add_argument("--force", action="store_true",
+                        help="Import even if nothing changed since the last import")
     args = parser.parse_args()
 
     # Parse source
@@ -177,26 +277,47 @@ def main():
     dest_parts = args.dest.split("/")
     dest_workspace = dest_parts[0]
     model_name = dest_parts[1].replace(".SemanticModel", "")
-
-    # Parse table
-    table_parts = args.table.split(".")
-    schema_name = table_parts[0]
-    table_name = table_parts[1]
+    dest_path = f"{dest_workspace}/{model_name}.SemanticModel"
+
+    # Parse tables
+    # Each table becomes tables/<name>.tmdl and a ref in model.tmdl, so table
+    # names must be unique (case-insensitively, like the model's own names)
+    tables = []
+    seen_tables = {}
+    for table_arg in args.tables:
+        if "." not in table_arg:
+            parser.error(f"Invalid table '{table_arg}'. Expected: schema.table_name")
+        schema_name, table_name = table_arg.split(".", 1)
+        key = table_name.lower()
+        if key in seen_tables:
+            if seen_tables[key].lower() == table_arg.lower():
+                continue
+            parser.error(f"Duplicate table name '{table_name}' in '{seen_tables[key]}' and '{table_arg}'")
+        seen_tables[key] = table_arg
+        tables.append((schema_name, table_name))
 
     print(f"Source: {src_workspace}/{src_lakehouse}")
-    print(f"Table: {schema_name}.{table_name}")
-    print(f"Dest: {dest_workspace}/{model_name}.SemanticModel")
+    print(f"Tables: {', '.join(f'{s}.{t}' for s, t in tables)}")
+    print(f"Dest: {dest_path}")
+
+    # Get SQL endpoint and all table schemas concurrently so fab startups overlap
+    print("\nGetting SQL endpoint and table schemas...")
+    with ThreadPoolExecutor(max_workers=min(MAX_FAB_WORKERS, len(tables) + 1)) as executor:
+        endpoint_future = executor.submit(get_lakehouse_sql_endpoint, src_workspace, src_lakehouse)
+        schemas = get_table_schemas(src_workspace, src_lakehouse, tables, executor)
+        endpoint = endpoint_future.result()
 
-    # Get SQL endpoint
-    print("\nGetting SQL endpoint...")
-    endpoint = get_lakehouse_sql_endpoint(src_workspace, src_lakehouse)
     print(f"  Connection: {endpoint['connectionString']}")
     print(f"  ID: {endpoint['id']}")
+    for (schema_name, table_name), columns in schemas.items():
+        print(f"  Found {len(columns)} columns in {schema_name}.{table_name}")
 
-    # Get table schema
-    print(f"\nGetting table schema for {schema_name}.{table_name}...")
-    columns = get_table_schema(src_workspace, src_lakehouse, schema_name, table_name)
-    print(f"  Found {len(columns)} columns")
+    # Skip the import when the model would be generated from identical inputs
+    digest = model_digest(dest_path, endpoint, schemas)
+    cache_file = CACHE_DIR / f"{dest_path}.sha256"
+    if not args.force and cache_file.is_file() and cache_file.read_text().strip() == digest:
+        print("\nNo TMDL changes, skipping import (use --force to import anyway)")
+        return
 
     # Create temp directory with TMDL
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -204,34 +325,38 @@ def main():
         def_dir = model_dir / "definition"
         tables_dir = def_dir / "tables"
 
-        model_dir.mkdir()
-        def_dir.mkdir()
-        tables_dir.mkdir()
+        tables_dir.mkdir(parents=True, exist_ok=True)
 
         # Write files
         print("\nCreating TMDL files...")
 
         (model_dir / ".platform").write_text(create_platform(model_name))
         (model_dir / "definition.pbism").write_text(create_pbism())
-        (def_dir / "model.tmdl").write_text(create_model_tmdl(model_name, table_name))
+        (def_dir / "model.tmdl").write_text(
+            create_model_tmdl(model_name, [table_name for _, table_name in tables])
+        )
         (def_dir / "database.tmdl").write_text(create_database_tmdl())
         (def_dir / "expressions.tmdl").write_text(
             create_expressions_tmdl(endpoint['connectionString'], endpoint['id'])
         )
-        (tables_dir / f"{table_name}.tmdl").write_text(
-            create_table_tmdl(table_name, schema_name, columns)
-        )
+        for (schema_name, table_name), columns in schemas.items():
+            (tables_dir / f"{table_name}.tmdl").write_text(
+                create_table_tmdl(table_name, schema_name, columns)
+            )
 
         print(f"  Created: {model_dir}")
-        for f in model_dir.rglob("*"):
-            if f.is_file():
-                print(f"    {f.relative_to(model_dir)}")
+        if args.verbose:
+            for path in _walk_files(model_dir):
+                print(f"    {os.path.relpath(path, model_dir)}")
 
         # Import to Fabric
         print(f"\nImporting to {dest_workspace}...")
-        dest_path = f"{dest_workspace}/{model_name}.SemanticModel"
-        result = run_fab(["import", dest_path, "-i", str(model_dir), "-f"])
-        print(result)
+        result = _run_fab(["import", dest_path, "-i", str(model_dir), "-f"])
+        print(result.stdout.strip())
+
+    if result.returncode == 0:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(digest)
 
     print("\nDone!")
 
@@ -8,26 +8,34 @@ Usage:
     python3 download_workspace.py "Workspace.Workspace" [output_dir]
     python3 download_workspace.py "Sales.Workspace" ./backup
     python3 download_workspace.py "Production.Workspace" --no-lakehouse-files
+    python3 download_workspace.py "Sales.Workspace" --parallel 4
 
 Requirements:
     - fab CLI installed and authenticated
     - azure-storage-file-datalake (for lakehouse files)
     - azure-identity
+    - requests and Azure CLI (optional: look up the workspace, items and tables via the Fabric REST API instead of fab)
 """
 
 import subprocess
 import json
 import sys
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from collections import defaultdict
 
 try:
-    from azure.storage.filedatalake import DataLakeServiceClient
-    from azure.identity import DefaultAzureCredential
-    AZURE_AVAILABLE = True
+    import requests
+    REQUESTS_AVAILABLE = True
 except ImportError:
-    AZURE_AVAILABLE = False
+    REQUESTS_AVAILABLE = False
+
+# Concurrent fab exports / lakehouse file downloads (all I/O-bound)
+DEFAULT_PARALLEL = 8
+
+FABRIC_API = "https://api.fabric.microsoft.com/v1"
+FABRIC_RESOURCE = "https://api.fabric.microsoft.com"
 
 
 #region Helper Functions
@@ -65,8 +73,8 @@ def parse_workspace_path(path: str) -> str:
     Returns:
         Normalized path with .Workspace extension
     """
-    if ".Workspace" not in path:
-        return f"{path}.Workspace"
+    if not path.endswith(".Workspace"):
+        return path + ".Workspace"
     return path
 
 
@@ -140,10 +148,125 @@ def export_item(workspace_path: str, item_name: str, item_type: str, output_path
 #endregion
 
 
+#region Fabric REST API
+
+
+def get_fabric_token() -> str | None:
+    """
+    Get a Fabric API access token using Azure CLI.
+
+    Returns:
+        Access token string, or None if az is missing or not logged in
+    """
+    try:
+        result = subprocess.run(
+            ["az", "account", "get-access-token", "--resource", FABRIC_RESOURCE,
+             "--query", "accessToken", "-o", "tsv"],
+            capture_output=True,
+            text=True,
+            timeout=30
+        )
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return None
+    token = result.stdout.strip()
+    return token if result.returncode == 0 and token else None
+
+
+def get_api_session() -> "requests.Session | None":
+    """
+    Create a connection-pooled session authenticated for the Fabric REST API.
+
+    Returns:
+        Session, or None if requests or a token is unavailable (callers fall back to fab)
+    """
+    if not REQUESTS_AVAILABLE:
+        return None
+    token = get_fabric_token()
+    if not token:
+        return None
+    session = requests.Session()
+    session.headers["Authorization"] = f"Bearer {token}"
+    return session
+
+
+def _get_paged(session: "requests.Session", url: str, key: str) -> list:
+    """
+    GET a Fabric list endpoint, following continuationUri across pages.
+
+    Args:
+        session: Authenticated API session
+        url: First page URL
+        key: Response field holding the page's records ("value" or "data")
+
+    Returns:
+        All records from all pages
+    """
+    records = []
+    while url:
+        response = session.get(url, timeout=60)
+        response.raise_for_status()
+        page = response.json()
+        records.extend(page.get(key, []))
+        url = page.get("continuationUri")
+    return records
+
+
+def get_workspace_id_api(session: "requests.Session", workspace_name: str) -> str | None:
+    """
+    Look up a workspace ID by display name from the Fabric REST API.
+
+    Args:
+        session: Authenticated API session
+        workspace_name: Workspace display name (without .Workspace)
+
+    Returns:
+        Workspace GUID, or None if no accessible workspace has that name
+    """
+    for workspace in _get_paged(session, f"{FABRIC_API}/workspaces", "value"):
+        if workspace["displayName"] == workspace_name:
+            return workspace["id"]
+    return None
+
+
+def get_workspace_items_api(session: "requests.Session", workspace_id: str) -> list:
+    """
+    Get all items in workspace from the Fabric REST API.
+
+    Args:
+        session: Authenticated API session
+        workspace_id: Workspace GUID
+
+    Returns:
+        List of items with metadata (same shape as get_workspace_items)
+    """
+    items = _get_paged(session, f"{FABRIC_API}/workspaces/{workspace_id}/items", "value")
+    return [{"displayName": item["displayName"], "type": item["type"], "id": item["id"]} for item in items]
+
+
+def list_lakehouse_tables_api(session: "requests.Session", workspace_id: str, lakehouse_id: str) -> list:
+    """
+    List tables in lakehouse from the Fabric REST API.
+
+    Args:
+        session: Authenticated API session
+        workspace_id: Workspace GUID
+        lakehouse_id: Lakehouse GUID
+
+    Returns:
+        List of table names
+    """
+    tables = _get_paged(session, f"{FABRIC_API}/workspaces/{workspace_id}/lakehouses/{lakehouse_id}/tables", "data")
+    return [table["name"] for table in tables]
+
+
+#endregion
+
+
 #region Lakehouse Operations
 
 
-def download_lakehouse_files(workspace_id: str, lakehouse_id: str, lakehouse_name: str, output_dir: Path):
+def download_lakehouse_files(workspace_id: str, lakehouse_id: str, lakehouse_name: str, output_dir: Path,
+                             parallel: int = DEFAULT_PARALLEL):
     """
     Download all files from lakehouse using OneLake Storage API.
 
@@ -152,8 +275,14 @@ def download_lakehouse_files(workspace_id: str, lakehouse_id: str, lakehouse_nam
         lakehouse_id: Lakehouse GUID
         lakehouse_name: Lakehouse display name
         output_dir: Output directory for files
+        parallel: Number of files to download concurrently
     """
-    if not AZURE_AVAILABLE:
+    # Imported here rather than at module level: the Azure SDKs load hundreds of
+    # modules, which --help and --no-lakehouse-files runs never need
+    try:
+        from azure.storage.filedatalake import DataLakeServiceClient
+        from azure.identity import DefaultAzureCredential
+    except ImportError:
         print(f"  Skipping lakehouse files (azure-storage-file-datalake not installed)")
         return
 
@@ -167,31 +296,48 @@ def download_lakehouse_files(workspace_id: str, lakehouse_id: str, lakehouse_nam
         fs_client = service_client.get_file_system_client(file_system=workspace_id)
         base_path = f"{lakehouse_id}/Files"
 
+        def download(remote_path: str, local_file: Path):
+            file_client = fs_client.get_file_client(remote_path)
+            with open(local_file, 'wb') as f:
+                # readinto streams the body to disk in chunks instead of buffering it all
+                file_client.download_file(max_concurrency=2).readinto(f)
+
         try:
             paths = fs_client.get_paths(path=base_path, recursive=True)
 
-            file_count = 0
+            # One pass over the listing: every directory to create (listed ones and
+            # file parents) and every file to fetch
+            dirs = set()
+            files = []
             dir_count = 0
-
+            prefix = base_path + "/"
             for path in paths:
-                relative_path = path.name[len(base_path)+1:] if len(path.name) > len(base_path) else path.name
+                relative_path = path.name.removeprefix(prefix)
+                local_path = output_dir / relative_path
 
                 if path.is_directory:
-                    local_dir = output_dir / relative_path
-                    local_dir.mkdir(parents=True, exist_ok=True)
+                    dirs.add(local_path)
                     dir_count += 1
                 else:
-                    local_file = output_dir / relative_path
-                    local_file.parent.mkdir(parents=True, exist_ok=True)
+                    dirs.add(local_path.parent)
+                    files.append((path.name, local_path, relative_path))
 
-                    file_client = fs_client.get_file_client(path.name)
-
-                    with open(local_file, 'wb') as f:
-                        download = file_client.download_file()
-                        f.write(download.readall())
+            # Deduplicated and parents first, so each directory gets a single mkdir
+            # call rather than one per file in it
+            for local_dir in sorted(dirs, key=lambda d: len(d.parts)):
+                local_dir.mkdir(parents=True, exist_ok=True)
 
+            # Each file is an independent GET, so those run concurrently
+            file_count = 0
+            with ThreadPoolExecutor(max_workers=parallel) as executor:
+                futures = {
+                    executor.submit(download, remote_path, local_file): relative_path
+                    for remote_path, local_file, relative_path in files
+                }
+                for future in as_completed(futures):
+                    future.result()
                     file_count += 1
-                    print(f"    {relative_path}")
+                    print(f"    {futures[future]}")
 
             print(f"  Downloaded {file_count} files, {dir_count} directories")
 
@@ -260,7 +406,8 @@ def export_table_schema(workspace_path: str, lakehouse_name: str, table_name: st
 #region Main Download
 
 
-def download_workspace(workspace_path: str, output_dir: Path, download_lakehouse_files_flag: bool = True):
+def download_workspace(workspace_path: str, output_dir: Path, download_lakehouse_files_flag: bool = True,
+                       parallel: int = DEFAULT_PARALLEL):
     """
     Download complete workspace contents.
 
@@ -268,6 +415,7 @@ def download_workspace(workspace_path: str, output_dir: Path, download_lakehouse
         workspace_path: Workspace path (e.g., "Sales.Workspace")
         output_dir: Output directory
         download_lakehouse_files_flag: Whether to download lakehouse files
+        parallel: Number of concurrent item exports and file downloads
     """
     print(f"Downloading workspace: {workspace_path}")
     print(f"Output directory: {output_dir}")
@@ -275,15 +423,34 @@ def download_workspace(workspace_path: str, output_dir: Path, download_lakehouse
 
     output_dir.mkdir(parents=True, exist_ok=True)
 
+    # One token for all lookups: each is then an HTTP request on a pooled
+    # connection rather than a fab process start plus text scraping. fab has no
+    # long-running mode to reuse, so only the exports themselves still spawn it.
+    session = get_api_session()
+
     # Get workspace ID
     print("Getting workspace ID...")
-    workspace_id = run_fab_command(["get", workspace_path, "-q", "id"])
+    workspace_id = None
+    if session:
+        try:
+            workspace_id = get_workspace_id_api(session, workspace_path.removesuffix(".Workspace"))
+        except requests.RequestException as e:
+            print(f"  Fabric API unavailable ({e}), using fab get")
+    if not workspace_id:
+        workspace_id = run_fab_command(["get", workspace_path, "-q", "id"]).strip('"')
     print(f"Workspace ID: {workspace_id}")
     print()
 
     # Get all items
     print("Discovering workspace items...")
-    items = get_workspace_items(workspace_path)
+    items = None
+    if session:
+        try:
+            items = get_workspace_items_api(session, workspace_id)
+        except requests.RequestException as e:
+            print(f"  Fabric API unavailable ({e}), using fab ls")
+    if items is None:
+        items = get_workspace_items(workspace_path)
 
     if not items:
         print("No items found")
@@ -304,35 +471,38 @@ def download_workspace(workspace_path: str, output_dir: Path, download_lakehouse
     total_failed = 0
     lakehouses = []
 
-    # Download items by type
-    for item_type, type_items in sorted(items_by_type.items()):
-        print(f"Downloading {item_type} items ({len(type_items)})...")
-
-        type_dir = output_dir / item_type
-        type_dir.mkdir(parents=True, exist_ok=True)
+    # Download items: each fab export is a separate process waiting on the
+    # network, so run several at once
+    print(f"Downloading {len(items)} items ({parallel} at a time)...")
 
-        for item in type_items:
-            item_name = item["displayName"]
-            item_id = item["id"]
+    with ThreadPoolExecutor(max_workers=parallel) as executor:
+        futures = {}
+        for item_type, type_items in sorted(items_by_type.items()):
+            type_dir = output_dir / item_type
+            type_dir.mkdir(parents=True, exist_ok=True)
 
-            print(f"  {item_name}...")
+            for item in type_items:
+                item_name = item["displayName"]
+                item_id = item["id"]
 
-            if item_type == "Lakehouse" and download_lakehouse_files_flag:
-                lakehouses.append({
-                    "name": item_name,
-                    "id": item_id,
-                    "output_dir": type_dir / f"{item_name}.Lakehouse"
-                })
+                if item_type == "Lakehouse" and download_lakehouse_files_flag:
+                    lakehouses.append({
+                        "name": item_name,
+                        "id": item_id,
+                        "output_dir": type_dir / f"{item_name}.Lakehouse"
+                    })
 
-            success = export_item(workspace_path, item_name, item_type, type_dir)
+                future = executor.submit(export_item, workspace_path, item_name, item_type, type_dir)
+                futures[future] = f"{item_name}.{item_type}"
 
-            if success:
+        for future in as_completed(futures):
+            if future.result():
                 total_success += 1
-                print(f"  Done: {item_name}")
+                print(f"  Done: {futures[future]}")
             else:
                 total_failed += 1
 
-        print()
+    print()
 
     # Download lakehouse files
     if lakehouses and download_lakehouse_files_flag:
@@ -346,12 +516,21 @@ def download_workspace(workspace_path: str, output_dir: Path, download_lakehouse
                 workspace_id=workspace_id,
                 lakehouse_id=lh["id"],
                 lakehouse_name=lh["name"],
-                output_dir=lh_files_dir
+                output_dir=lh_files_dir,
+                parallel=parallel
             )
 
             # Export table schemas
             print(f"\n  Exporting table schemas from {lh['name']}...")
-            tables = list_lakehouse_tables(workspace_path, lh["name"])
+            tables = None
+            if session:
+                try:
+                    tables = list_lakehouse_tables_api(session, workspace_id, lh["id"])
+                except requests.RequestException:
+                    # e.g. schema-enabled lakehouses, which this endpoint does not list
+                    pass
+            if tables is None:
+                tables = list_lakehouse_tables(workspace_path, lh["name"])
 
             if tables:
                 tables_dir = lh["output_dir"] / "Tables"
@@ -392,6 +571,7 @@ Examples:
     python3 download_workspace.py "Sales.Workspace"
     python3 download_workspace.py "Production.Workspace" ./backup
     python3 download_workspace.py "dev.Workspace" --no-lakehouse-files
+    python3 download_workspace.py "Sales.Workspace" --parallel 4
         """
     )
 
@@ -400,13 +580,15 @@ Examples:
                         help="Output directory (default: ./workspace_downloads/<name>)")
     parser.add_argument("--no-lakehouse-files", action="store_true",
                         help="Skip downloading lakehouse files")
+    parser.add_argument("--parallel", type=int, default=DEFAULT_PARALLEL, metavar="N",
+                        help=f"Concurrent exports and file downloads (default: {DEFAULT_PARALLEL})")
 
     args = parser.parse_args()
 
     workspace_path = parse_workspace_path(args.workspace)
 
     # Extract name for default output dir
-    workspace_name = workspace_path.replace(".Workspace", "")
+    workspace_name = workspace_path.removesuffix(".Workspace")
 
     if args.output_dir:
         output_dir = Path(args.output_dir)
@@ -417,7 +599,8 @@ Examples:
         download_workspace(
             workspace_path=workspace_path,
             output_dir=output_dir,
-            download_lakehouse_files_flag=not args.no_lakehouse_files
+            download_lakehouse_files_flag=not args.no_lakehouse_files,
+            parallel=max(1, args.parallel)
         )
     except KeyboardInterrupt:
         print("\n\nDownload interrupted by user")
@@ -10,6 +10,7 @@ Usage:
 
 Requirements:
     - fab CLI installed and authenticated
+    - requests and Azure CLI (optional: resolve IDs via the Power BI REST API instead of fab get)
 """
 
 import argparse
@@ -18,6 +19,23 @@ import subprocess
 import sys
 import re
 
+# Optional: requests resolves workspace/model IDs over REST instead of two fab processes
+try:
+    import requests
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
+# Optional: orjson parses large query results much faster than the stdlib
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+POWERBI_API = "https://api.powerbi.com/v1.0/myorg"
+POWERBI_RESOURCE = "https://analysis.windows.net/powerbi/api"
+
 
 #region Helper Functions
 
@@ -71,11 +89,11 @@ def parse_path(path: str) -> tuple[str, str]:
     workspace = parts[0]
     item = parts[1]
 
-    if ".Workspace" not in workspace:
-        workspace = f"{workspace}.Workspace"
+    if not workspace.endswith(".Workspace"):
+        workspace += ".Workspace"
 
-    if ".SemanticModel" not in item:
-        item = f"{item}.SemanticModel"
+    if not item.endswith(".SemanticModel"):
+        item += ".SemanticModel"
 
     return workspace, item
 
@@ -94,23 +112,98 @@ def get_id(path: str) -> str:
     return output.strip('"')
 
 
+def get_api_session() -> "requests.Session | None":
+    """
+    Create a session authenticated for the Power BI REST API using an Azure CLI token.
+
+    Returns:
+        Session, or None if requests, az or a login is unavailable (callers fall back to fab)
+    """
+    if not REQUESTS_AVAILABLE:
+        return None
+    try:
+        result = subprocess.run(
+            ["az", "account", "get-access-token", "--resource", POWERBI_RESOURCE,
+             "--query", "accessToken", "-o", "tsv"],
+            capture_output=True,
+            text=True,
+            timeout=30
+        )
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return None
+    token = result.stdout.strip()
+    if result.returncode != 0 or not token:
+        return None
+    session = requests.Session()
+    session.headers["Authorization"] = f"Bearer {token}"
+    return session
+
+
+def resolve_workspace_and_item(session: "requests.Session", workspace: str, item: str) -> tuple[str, str]:
+    """
+    Resolve workspace and semantic model IDs with two REST calls.
+
+    Args:
+        session: Authenticated API session
+        workspace: Workspace path, e.g. "Sales.Workspace"
+        item: Model path, e.g. "Sales Model.SemanticModel"
+
+    Returns:
+        Tuple of (workspace_id, dataset_id)
+
+    Raises:
+        LookupError if the workspace or model is not found
+        requests.RequestException if an API call fails
+    """
+    workspace_name = workspace.removesuffix(".Workspace")
+    model_name = item.removesuffix(".SemanticModel")
+
+    # OData string literals escape ' by doubling it
+    odata_name = workspace_name.replace("'", "''")
+    response = session.get(f"{POWERBI_API}/groups", params={"$filter": f"name eq '{odata_name}'"}, timeout=30)
+    response.raise_for_status()
+    groups = _jloads(response.content).get("value", [])
+    if not groups:
+        raise LookupError(f"Workspace not found: {workspace_name}")
+    workspace_id = groups[0]["id"]
+
+    response = session.get(f"{POWERBI_API}/groups/{workspace_id}/datasets", timeout=30)
+    response.raise_for_status()
+    for dataset in _jloads(response.content).get("value", []):
+        if dataset.get("name") == model_name:
+            return workspace_id, dataset["id"]
+    raise LookupError(f"Semantic model not found: {model_name}")
+
+
+def _jloads(data):
+    """Parse JSON from str or bytes, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 #endregion
 
 
 #region DAX Execution
 
 
-def execute_dax_query(workspace_id: str, dataset_id: str, query: str, include_nulls: bool = False) -> dict:
+def execute_dax_query(workspace_id: str, dataset_id: str, query: str, include_nulls: bool = False,
+                      session: "requests.Session | None" = None) -> dict:
     """
-    Execute DAX query against semantic model using Fabric CLI.
+    Execute DAX query against semantic model via the Power BI executeQueries API.
 
-    Uses Power BI API via fab CLI: fab api -A powerbi
+    With a session, the query is POSTed straight to the Power BI REST endpoint
+    (no fab process); an HTTP error status exits, while a connection-level
+    failure (requests.RequestException) falls back to fab. Without a session,
+    or on that fallback, it runs through the Fabric CLI: fab api -A powerbi.
 
     Args:
         workspace_id: Workspace GUID
         dataset_id: Semantic model GUID
         query: DAX query string
         include_nulls: Whether to include null values in results
+        session: Optional authenticated Power BI API session (see get_api_session)
 
     Returns:
         Query results as dict
@@ -122,6 +215,18 @@ def execute_dax_query(workspace_id: str, dataset_id: str, query: str, include_nu
 
     endpoint = f"groups/{workspace_id}/datasets/{dataset_id}/executeQueries"
 
+    if session:
+        try:
+            response = session.post(f"{POWERBI_API}/{endpoint}", json=payload, timeout=300)
+        except requests.RequestException as e:
+            print(f"API request failed ({e}), falling back to fab", file=sys.stderr)
+        else:
+            if not response.ok:
+                print(f"Error running query: HTTP {response.status_code}: {response.text}", file=sys.stderr)
+                sys.exit(1)
+            # Same shape as fab api output, so the formatters and JSON output are unchanged
+            return {"status_code": response.status_code, "text": _jloads(response.content)}
+
     output = run_fab_command([
         "api",
         "-A", "powerbi",
@@ -130,7 +235,7 @@ def execute_dax_query(workspace_id: str, dataset_id: str, query: str, include_nu
         "-i", json.dumps(payload)
     ])
 
-    return json.loads(output)
+    return _jloads(output)
 
 
 #endregion
@@ -139,10 +244,32 @@ def execute_dax_query(workspace_id: str, dataset_id: str, query: str, include_nu
 #region Output Formatting
 
 
-def format_results_as_table(results: dict) -> str:
-    """Format query results as ASCII table."""
-    output_lines = []
+def format_results_as_table(results: dict, sink=None) -> str | None:
+    """
+    Format query results as ASCII table.
+
+    Args:
+        results: Query results from execute_dax_query
+        sink: Optional text file-like object; lines are written to it as they are
+            produced instead of being joined into one string
+
+    Returns:
+        Table as string, or None if written to sink
+    """
+    lines = _table_lines(results)
+    if sink is None:
+        return "\n".join(lines)
+
+    # Same text as "\n".join(lines), without holding it all in memory
+    for i, line in enumerate(lines):
+        if i:
+            sink.write("\n")
+        sink.write(line)
+    return None
+
 
+def _table_lines(results: dict):
+    """Yield the lines of the ASCII table for each result table."""
     if "text" in results:
         data = results["text"]
     else:
@@ -155,37 +282,41 @@ def format_results_as_table(results: dict) -> str:
             rows = table.get("rows", [])
 
             if not rows:
-                output_lines.append("(No rows returned)")
+                yield "(No rows returned)"
                 continue
 
             columns = list(rows[0].keys())
 
-            widths = {col: len(col) for col in columns}
-            for row in rows:
-                for col in columns:
-                    value_str = str(row.get(col, ""))
-                    widths[col] = max(widths[col], len(value_str))
+            # Stringify each cell once; widths and output both read this matrix
+            str_rows = [[str(row.get(col, "")) for col in columns] for row in rows]
+            widths = [max(len(col), max(len(r[i]) for r in str_rows)) for i, col in enumerate(columns)]
 
-            header = " | ".join(col.ljust(widths[col]) for col in columns)
-            output_lines.append(header)
-            output_lines.append("-" * len(header))
+            header = " | ".join(col.ljust(width) for col, width in zip(columns, widths))
+            yield header
+            yield "-" * len(header)
 
-            for row in rows:
-                row_str = " | ".join(str(row.get(col, "")).ljust(widths[col]) for col in columns)
-                output_lines.append(row_str)
+            for str_row in str_rows:
+                yield " | ".join(value.ljust(width) for value, width in zip(str_row, widths))
 
-            output_lines.append("")
-            output_lines.append(f"({len(rows)} row(s) returned)")
+            yield ""
+            yield f"({len(rows)} row(s) returned)"
 
-    return "\n".join(output_lines)
 
+def format_results_as_csv(results: dict, sink=None) -> str | None:
+    """
+    Format query results as CSV.
 
-def format_results_as_csv(results: dict) -> str:
-    """Format query results as CSV."""
+    Args:
+        results: Query results from execute_dax_query
+        sink: Optional text file-like object to write rows to directly
+
+    Returns:
+        CSV as string, or None if written to sink
+    """
     import csv
     import io
 
-    output = io.StringIO()
+    output = io.StringIO() if sink is None else sink
 
     if "text" in results:
         data = results["text"]
@@ -205,7 +336,37 @@ def format_results_as_csv(results: dict) -> str:
                 writer.writeheader()
                 writer.writerows(rows)
 
-    return output.getvalue()
+    return output.getvalue() if sink is None else None
+
+
+def write_results(results: dict, output_format: str, sink) -> None:
+    """
+    Write query results to a text sink in the given format, without building the whole output first.
+
+    Args:
+        results: Query results from execute_dax_query
+        output_format: "json", "csv" or "table"
+        sink: Text file-like object (open output file or sys.stdout)
+    """
+    if output_format == "json":
+        _write_json(results, sink)
+    elif output_format == "csv":
+        format_results_as_csv(results, sink)
+    else:
+        format_results_as_table(results, sink)
+
+
+def _write_json(results: dict, sink) -> None:
+    """Write results as 2-space indented JSON; with orjson, the UTF-8 bytes go straight to the sink's byte buffer."""
+    buffer = getattr(sink, "buffer", None)
+    encoding = (getattr(sink, "encoding", None) or "").lower().replace("-", "")
+    if not ORJSON_AVAILABLE or buffer is None or encoding != "utf8":
+        # orjson writes non-ASCII characters raw, which a non-UTF-8 console or
+        # file encoding may not represent; the stdlib escapes them as \uXXXX
+        json.dump(results, sink, indent=2)
+        return
+    sink.flush()
+    buffer.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
 
 
 #endregion
@@ -238,6 +399,8 @@ DAX Requirements:
                         help="Output format (default: table)")
     parser.add_argument("--include-nulls", action="store_true",
                         help="Include null values in results")
+    parser.add_argument("--no-api", action="store_true",
+                        help="Resolve IDs and run the query through fab instead of the Power BI REST API")
 
     args = parser.parse_args()
 
@@ -248,33 +411,38 @@ DAX Requirements:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
 
-    # Get IDs
-    print(f"Resolving: {workspace}...", file=sys.stderr)
-    workspace_id = get_id(workspace)
-
+    # Get IDs: one token and two HTTP calls, instead of two fab processes
     full_path = f"{workspace}/{model}"
-    print(f"Resolving: {full_path}...", file=sys.stderr)
-    model_id = get_id(full_path)
+    ids = None
+    session = None if args.no_api else get_api_session()
+    if session:
+        print(f"Resolving: {full_path}...", file=sys.stderr)
+        try:
+            ids = resolve_workspace_and_item(session, workspace, model)
+        except (requests.RequestException, LookupError) as e:
+            print(f"API lookup failed ({e}), falling back to fab", file=sys.stderr)
+
+    if ids:
+        workspace_id, model_id = ids
+    else:
+        print(f"Resolving: {workspace}...", file=sys.stderr)
+        workspace_id = get_id(workspace)
+
+        print(f"Resolving: {full_path}...", file=sys.stderr)
+        model_id = get_id(full_path)
 
     # Execute query
     print(f"Executing DAX query...", file=sys.stderr)
-    results = execute_dax_query(workspace_id, model_id, args.query, args.include_nulls)
-
-    # Format results
-    if args.format == "json":
-        formatted_output = json.dumps(results, indent=2)
-    elif args.format == "csv":
-        formatted_output = format_results_as_csv(results)
-    else:
-        formatted_output = format_results_as_table(results)
+    results = execute_dax_query(workspace_id, model_id, args.query, args.include_nulls, session)
 
-    # Output results
+    # Format results straight into the output file / stdout
     if args.output:
         with open(args.output, 'w') as f:
-            f.write(formatted_output)
+            write_results(results, args.format, f)
         print(f"\nResults saved to: {args.output}", file=sys.stderr)
     else:
-        print(formatted_output)
+        write_results(results, args.format, sys.stdout)
+        sys.stdout.write("\n")
 
 
 if __name__ == "__main__":
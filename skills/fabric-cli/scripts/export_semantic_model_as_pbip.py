@@ -12,42 +12,177 @@ Requirements:
     - fab CLI installed and authenticated
 """
 
-import argparse
-import base64
+from __future__ import annotations
+
+import binascii
 import json
+import os
 import re
+import secrets
+import shutil
 import subprocess
 import sys
 import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from importlib.util import find_spec
+from itertools import chain
 from pathlib import Path
+from typing import Iterable, Iterator
+
+# Optional: orjson encodes/decodes JSON much faster than the stdlib
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional: pybase64 decodes with SIMD, several times faster on large TMDL payloads
+try:
+    import pybase64
+    PYBASE64_AVAILABLE = True
+except ImportError:
+    PYBASE64_AVAILABLE = False
+
+# Optional: ijson parses the definition as fab streams it, so parts are decoded
+# and written while the rest of a large definition is still arriving. Only
+# located here and imported where it is used, like the other path-specific
+# modules (argparse, tempfile, io), so it costs nothing at startup
+IJSON_AVAILABLE = find_spec("ijson") is not None
+
+# TMDL part writes are I/O-latency bound, so use more threads than cores
+WRITE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+_SEMANTIC_MODEL_SUFFIX_RE = re.compile(r'\.SemanticModel$', re.IGNORECASE)
+_UNSAFE_FS_TABLE = str.maketrans(dict.fromkeys('<>:"/\\|?*', '_'))
+_WS_COLLAPSE_RE = re.compile(r'\s+')
+
+# PBIP JSON schema URLs
+_SCHEMA_BASE = "https://developer.microsoft.com/json-schemas/fabric"
+_SCHEMA_PBIP = f"{_SCHEMA_BASE}/pbip/pbipProperties/1.0.0/schema.json"
+_SCHEMA_PLATFORM = f"{_SCHEMA_BASE}/gitIntegration/platformProperties/2.0.0/schema.json"
+_SCHEMA_PBIR = f"{_SCHEMA_BASE}/item/report/definitionProperties/1.0.0/schema.json"
+_SCHEMA_REPORT = f"{_SCHEMA_BASE}/item/report/definition/report/2.1.0/schema.json"
+_SCHEMA_VERSION = f"{_SCHEMA_BASE}/item/report/definition/versionMetadata/1.0.0/schema.json"
+_SCHEMA_PAGE = f"{_SCHEMA_BASE}/item/report/definition/page/2.0.0/schema.json"
+_SCHEMA_PAGES = f"{_SCHEMA_BASE}/item/report/definition/pagesMetadata/1.0.0/schema.json"
+_SCHEMA_PBISM = f"{_SCHEMA_BASE}/item/semanticModel/definitionProperties/1.0.0/schema.json"
+_SCHEMA_EDITOR_SETTINGS = f"{_SCHEMA_BASE}/item/semanticModel/editorSettings/1.0.0/schema.json"
+
+# Files whose content never varies between exports (read-only, never mutated)
+_REPORT_JSON_TEMPLATE = {
+    "$schema": _SCHEMA_REPORT,
+    "themeCollection": {
+        "baseTheme": {
+            "name": "CY24SU10",
+            "reportVersionAtImport": "5.59",
+            "type": "SharedResources"
+        }
+    },
+    "settings": {
+        "useStylableVisualContainerHeader": True,
+        "defaultDrillFilterOtherVisuals": True
+    }
+}
+
+_VERSION_JSON_TEMPLATE = {
+    "$schema": _SCHEMA_VERSION,
+    "version": "2.0.0"
+}
+
+_PBISM_TEMPLATE = {
+    "$schema": _SCHEMA_PBISM,
+    "version": "4.0",
+    "settings": {}
+}
+
+_EDITOR_SETTINGS_TEMPLATE = {
+    "$schema": _SCHEMA_EDITOR_SETTINGS,
+    "autodetectRelationships": True,
+    "parallelQueryLoading": True
+}
 
 
 #region Helper Functions
 
 
-def run_fab_command(args: list[str]) -> str:
+def _run_fab_in_process(args: list[str]) -> str | None:
+    """
+    Run a fab command inside this interpreter when fabric-cli is importable.
+
+    fab is a Python CLI, so calling its entry point directly skips the
+    process spawn and interpreter startup of a subprocess.
+
+    Args:
+        args: List of command arguments
+
+    Returns:
+        Command stdout as text, or None if fabric-cli is not importable
+
+    Raises:
+        SystemExit if command fails
+    """
+    try:
+        from fabric_cli.main import main as fab_main
+    except ImportError:
+        return None
+
+    import io
+    from contextlib import redirect_stderr, redirect_stdout
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    saved_argv = sys.argv
+    sys.argv = ["fab"] + args
+    try:
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            fab_main()
+        exit_code = 0
+    except SystemExit as e:
+        exit_code = e.code
+    finally:
+        sys.argv = saved_argv
+
+    if exit_code:
+        print(f"Error running fab command: {stderr.getvalue()}", file=sys.stderr)
+        sys.exit(1)
+
+    # Pass fab's warnings through, as the subprocess path does
+    if stderr.getvalue():
+        sys.stderr.write(stderr.getvalue())
+
+    return stdout.getvalue()
+
+
+def run_fab_command(args: list[str]) -> str | bytes:
     """
     Run fab CLI command and return output.
 
+    Uses fabric-cli in-process when it is importable, otherwise spawns fab.
+    Output is returned unstripped; JSON parsers skip surrounding whitespace.
+
     Args:
         args: List of command arguments
 
     Returns:
-        Command stdout as string
+        Command stdout, as raw bytes when fab was spawned
 
     Raises:
         SystemExit if command fails or fab not found
     """
+    output = _run_fab_in_process(args)
+    if output is not None:
+        return output
+
     try:
         result = subprocess.run(
             ["fab"] + args,
             capture_output=True,
-            text=True,
             check=True
         )
-        return result.stdout.strip()
+        return result.stdout
     except subprocess.CalledProcessError as e:
-        print(f"Error running fab command: {e.stderr}", file=sys.stderr)
+        stderr = e.stderr.decode("utf-8", errors="replace")
+        print(f"Error running fab command: {stderr}", file=sys.stderr)
         sys.exit(1)
     except FileNotFoundError:
         print("Error: fab CLI not found. Install from: https://microsoft.github.io/fabric-cli/", file=sys.stderr)
@@ -67,23 +202,42 @@ def parse_path(path: str) -> tuple[str, str, str]:
     Raises:
         ValueError if path format is invalid
     """
-    if "/" not in path:
+    workspace, sep, item = path.partition("/")
+    if not sep:
         raise ValueError(f"Invalid path format: {path}. Expected: Workspace.Workspace/Item.Type")
 
-    parts = path.split("/", 1)
-    workspace = parts[0]
-    item = parts[1]
+    if not workspace.endswith(".Workspace"):
+        workspace += ".Workspace"
 
-    if ".Workspace" not in workspace:
-        workspace = f"{workspace}.Workspace"
+    # Extract display name before adding extension (suffix match is case-insensitive)
+    if item.lower().endswith(".semanticmodel"):
+        display_name = item[:-len(".semanticmodel")]
+    else:
+        display_name = item
+        item += ".SemanticModel"
 
-    # Extract display name before adding extension
-    display_name = re.sub(r'\.SemanticModel$', '', item, flags=re.IGNORECASE)
+    return workspace, item, display_name
 
-    if ".SemanticModel" not in item:
-        item = f"{item}.SemanticModel"
 
-    return workspace, item, display_name
+def _jloads(data):
+    """Parse JSON from str or bytes, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _jdumps(obj) -> bytes:
+    """Serialize to 2-space indented UTF-8 JSON bytes (orjson produces bytes natively)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _b64decode(payload) -> bytes:
+    """Decode base64 with pybase64 when installed, else the binascii C primitive."""
+    if PYBASE64_AVAILABLE:
+        return pybase64.b64decode(payload, validate=False)
+    return binascii.a2b_base64(payload)
 
 
 def sanitize_name(name: str) -> str:
@@ -96,9 +250,9 @@ def sanitize_name(name: str) -> str:
     Returns:
         Filesystem-safe name
     """
-    name = re.sub(r'\.SemanticModel$', '', name, flags=re.IGNORECASE)
-    safe_name = re.sub(r'[<>:"/\\|?*]', '_', name)
-    safe_name = re.sub(r'\s+', ' ', safe_name)
+    name = _SEMANTIC_MODEL_SUFFIX_RE.sub('', name)
+    safe_name = name.translate(_UNSAFE_FS_TABLE)
+    safe_name = _WS_COLLAPSE_RE.sub(' ', safe_name)
     return safe_name.strip()
 
 
@@ -118,40 +272,118 @@ def get_model_definition(full_path: str) -> dict:
     Returns:
         Definition dict
     """
-    print(f"Fetching model definition...")
-
     output = run_fab_command(["get", full_path, "-q", "definition"])
 
     try:
-        return json.loads(output)
+        return _jloads(output)
     except json.JSONDecodeError:
         print("Error: Failed to parse model definition JSON", file=sys.stderr)
         sys.exit(1)
 
 
-def parse_tmdl_definition(definition: dict) -> dict[str, str]:
+def _stream_definition_parts(full_path: str) -> Iterator[dict]:
+    """
+    Start fab and return an iterator over the definition parts in its stdout.
+
+    fab is started and its first part read before returning, so a missing CLI,
+    a failed command (e.g. item not found, not authenticated) or invalid JSON
+    exits before any output folder exists; the rest of the JSON is parsed
+    incrementally as the parts are consumed.
+
+    Args:
+        full_path: Full path like "Workspace.Workspace/Model.SemanticModel"
+
+    Returns:
+        Iterator of part dicts with "path" and "payload" keys
+
+    Raises:
+        SystemExit if fab is not found, fails, or returns invalid JSON
+    """
+    import tempfile
+
+    import ijson
+
+    # stderr goes to a temp file so a chatty fab can never block on a full pipe
+    stderr_file = tempfile.TemporaryFile()
+    try:
+        proc = subprocess.Popen(
+            ["fab", "get", full_path, "-q", "definition"],
+            stdout=subprocess.PIPE,
+            stderr=stderr_file
+        )
+    except FileNotFoundError:
+        stderr_file.close()
+        print("Error: fab CLI not found. Install from: https://microsoft.github.io/fabric-cli/", file=sys.stderr)
+        sys.exit(1)
+
+    def parts() -> Iterator[dict]:
+        with proc, stderr_file:
+            try:
+                yield from ijson.items(proc.stdout, "parts.item")
+                parse_error = None
+            except ijson.JSONError as e:
+                # Drain the rest so fab can exit and report its own failure
+                parse_error = e
+                proc.stdout.read()
+            proc.wait()
+
+            if proc.returncode:
+                stderr_file.seek(0)
+                stderr = stderr_file.read().decode("utf-8", errors="replace")
+                print(f"Error running fab command: {stderr}", file=sys.stderr)
+                sys.exit(1)
+            if parse_error is not None:
+                print("Error: Failed to parse model definition JSON", file=sys.stderr)
+                sys.exit(1)
+
+    stream = parts()
+    first = next(stream, None)
+    if first is None:
+        return iter(())
+    return chain((first,), stream)
+
+
+def get_model_parts(full_path: str) -> Iterable[dict]:
     """
-    Parse TMDL definition parts from base64-encoded payload.
+    Get the model definition parts from Fabric.
+
+    Streams the parts out of fab's stdout when ijson is installed and fab runs
+    as a subprocess; otherwise the whole definition is fetched and parsed first.
 
     Args:
-        definition: Definition dict with parts array
+        full_path: Full path like "Workspace.Workspace/Model.SemanticModel"
 
     Returns:
-        Dict mapping path to decoded content
+        Iterable of part dicts with "path" and "payload" keys
     """
-    parts = {}
+    if IJSON_AVAILABLE and find_spec("fabric_cli") is None:
+        return _stream_definition_parts(full_path)
+    return get_model_definition(full_path).get("parts", ())
+
+
+def _decode_part(part: dict) -> bytes | None:
+    """Decode one definition part's payload, warning and returning None if it is invalid."""
+    try:
+        return _b64decode(part.get("payload", ""))
+    except Exception as e:
+        print(f"Warning: Failed to decode part {part['path']}: {e}", file=sys.stderr)
+        return None
 
-    for part in definition.get("parts", []):
-        path = part.get("path", "")
-        payload = part.get("payload", "")
 
-        try:
-            content = base64.b64decode(payload).decode("utf-8")
-            parts[path] = content
-        except Exception as e:
-            print(f"Warning: Failed to decode part {path}: {e}", file=sys.stderr)
+def iter_tmdl_parts(parts: Iterable[dict]) -> Iterator[tuple[str, bytes]]:
+    """
+    Decode TMDL definition parts from their base64-encoded payloads.
 
-    return parts
+    Args:
+        parts: Definition part dicts, e.g. definition["parts"] or a stream
+
+    Yields:
+        Tuples of (path, decoded content bytes), written to disk as-is;
+        parts without a path or with an undecodable payload are skipped
+    """
+    for part in parts:
+        if part.get("path") and (content := _decode_part(part)) is not None:
+            yield part["path"], content
 
 
 #endregion
@@ -160,30 +392,63 @@ def parse_tmdl_definition(definition: dict) -> dict[str, str]:
 #region PBIP Structure Creation
 
 
-def create_pbip_structure(definition: dict, output_path: Path, model_name: str):
+@dataclass(slots=True)
+class ExportContext:
+    """Names, folders and logical IDs shared by every file of one PBIP export."""
+
+    safe_name: str
+    container: Path
+    report_folder: Path
+    model_folder: Path
+    report_logical_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    model_logical_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+
+    @classmethod
+    def build(cls, output_path: Path, safe_name: str) -> "ExportContext":
+        """Resolve the PBIP folder layout for a sanitized model name."""
+        container = output_path / safe_name
+        return cls(
+            safe_name=safe_name,
+            container=container,
+            report_folder=container / f"{safe_name}.Report",
+            model_folder=container / f"{safe_name}.SemanticModel",
+        )
+
+
+def create_pbip_structure(parts: Iterable[dict], output_path: Path, model_name: str,
+                          verbose: bool = False):
     """
     Create PBIP folder structure with model definition.
 
     Args:
-        definition: Model definition dict
+        parts: Model definition parts
         output_path: Output directory
         model_name: Model display name
+        verbose: Print progress before the final summary
     """
     safe_name = sanitize_name(model_name)
+    ctx = ExportContext.build(output_path, safe_name)
 
-    container_path = output_path / safe_name
+    container_path = ctx.container
     container_path.mkdir(parents=True, exist_ok=True)
 
-    print(f"Creating PBIP structure in: {container_path}")
+    # Replace any previous export of this model outright; leftover pages or
+    # TMDL files for dropped tables would otherwise end up in the project
+    for folder in (ctx.report_folder, ctx.model_folder):
+        if folder.exists():
+            shutil.rmtree(folder)
+
+    if verbose:
+        print(f"Creating PBIP structure in: {container_path}")
 
     # Create .pbip metadata file
     pbip_metadata = {
-        "$schema": "https://developer.microsoft.com/json-schemas/fabric/pbip/pbipProperties/1.0.0/schema.json",
+        "$schema": _SCHEMA_PBIP,
         "version": "1.0",
         "artifacts": [
             {
                 "report": {
-                    "path": f"{safe_name}.Report"
+                    "path": ctx.report_folder.name
                 }
             }
         ],
@@ -193,166 +458,146 @@ def create_pbip_structure(definition: dict, output_path: Path, model_name: str):
     }
 
     pbip_file = container_path / f"{safe_name}.pbip"
-    with open(pbip_file, "w", encoding="utf-8") as f:
-        json_str = json.dumps(pbip_metadata, indent=2)
-        json_str = json_str.replace(': True', ': true').replace(': False', ': false')
-        f.write(json_str)
+    pbip_file.write_bytes(_jdumps(pbip_metadata))
 
-    create_report_folder(container_path, safe_name)
-    create_model_folder(container_path, safe_name, definition)
+    create_report_folder(ctx)
+    part_count = create_model_folder(ctx, parts)
 
-    print(f"PBIP created: {container_path}")
+    print(f"PBIP created: {container_path} ({part_count} TMDL parts)")
     print(f"Open in Power BI Desktop: {pbip_file}")
 
 
-def create_report_folder(container_path: Path, safe_name: str):
+def create_report_folder(ctx: ExportContext):
     """Create minimal Report folder structure."""
-    report_folder = container_path / f"{safe_name}.Report"
+    safe_name = ctx.safe_name
+    report_folder = ctx.report_folder
     report_folder.mkdir(parents=True, exist_ok=True)
 
     # .platform file
     platform_content = {
-        "$schema": "https://developer.microsoft.com/json-schemas/fabric/gitIntegration/platformProperties/2.0.0/schema.json",
+        "$schema": _SCHEMA_PLATFORM,
         "metadata": {
             "type": "Report",
             "displayName": safe_name
         },
         "config": {
             "version": "2.0",
-            "logicalId": str(uuid.uuid4())
+            "logicalId": ctx.report_logical_id
         }
     }
 
-    with open(report_folder / '.platform', 'w', encoding='utf-8') as f:
-        json.dump(platform_content, f, indent=2)
+    (report_folder / '.platform').write_bytes(_jdumps(platform_content))
 
     # definition.pbir
     pbir_content = {
-        "$schema": "https://developer.microsoft.com/json-schemas/fabric/item/report/definitionProperties/1.0.0/schema.json",
+        "$schema": _SCHEMA_PBIR,
         "version": "4.0",
         "datasetReference": {
             "byPath": {
-                "path": f"../{safe_name}.SemanticModel"
+                "path": f"../{ctx.model_folder.name}"
             }
         }
     }
 
-    with open(report_folder / 'definition.pbir', 'w', encoding='utf-8') as f:
-        json.dump(pbir_content, f, indent=2)
+    (report_folder / 'definition.pbir').write_bytes(_jdumps(pbir_content))
 
     # definition folder
     definition_folder = report_folder / 'definition'
     definition_folder.mkdir()
 
     # report.json
-    report_json = {
-        "$schema": "https://developer.microsoft.com/json-schemas/fabric/item/report/definition/report/2.1.0/schema.json",
-        "themeCollection": {
-            "baseTheme": {
-                "name": "CY24SU10",
-                "reportVersionAtImport": "5.59",
-                "type": "SharedResources"
-            }
-        },
-        "settings": {
-            "useStylableVisualContainerHeader": True,
-            "defaultDrillFilterOtherVisuals": True
-        }
-    }
-
-    with open(definition_folder / 'report.json', 'w', encoding='utf-8') as f:
-        json_str = json.dumps(report_json, indent=2)
-        json_str = json_str.replace(': True', ': true').replace(': False', ': false')
-        f.write(json_str)
+    (definition_folder / 'report.json').write_bytes(_jdumps(_REPORT_JSON_TEMPLATE))
 
     # version.json
-    with open(definition_folder / 'version.json', 'w', encoding='utf-8') as f:
-        json.dump({
-            "$schema": "https://developer.microsoft.com/json-schemas/fabric/item/report/definition/versionMetadata/1.0.0/schema.json",
-            "version": "2.0.0"
-        }, f, indent=2)
+    (definition_folder / 'version.json').write_bytes(_jdumps(_VERSION_JSON_TEMPLATE))
 
     # blank page
     pages_folder = definition_folder / 'pages'
     pages_folder.mkdir()
 
-    page_id = str(uuid.uuid4()).replace('-', '')[:16]
+    page_id = secrets.token_hex(8)
     page_folder = pages_folder / page_id
     page_folder.mkdir()
 
-    with open(page_folder / 'page.json', 'w', encoding='utf-8') as f:
-        json.dump({
-            "$schema": "https://developer.microsoft.com/json-schemas/fabric/item/report/definition/page/2.0.0/schema.json",
-            "name": page_id,
-            "displayName": "Page 1",
-            "width": 1920,
-            "height": 1080
-        }, f, indent=2)
+    (page_folder / 'page.json').write_bytes(_jdumps({
+        "$schema": _SCHEMA_PAGE,
+        "name": page_id,
+        "displayName": "Page 1",
+        "width": 1920,
+        "height": 1080
+    }))
 
     (page_folder / 'visuals').mkdir()
 
-    with open(pages_folder / 'pages.json', 'w', encoding='utf-8') as f:
-        json.dump({
-            "$schema": "https://developer.microsoft.com/json-schemas/fabric/item/report/definition/pagesMetadata/1.0.0/schema.json",
-            "pageOrder": [page_id],
-            "activePageName": page_id
-        }, f, indent=2)
+    (pages_folder / 'pages.json').write_bytes(_jdumps({
+        "$schema": _SCHEMA_PAGES,
+        "pageOrder": [page_id],
+        "activePageName": page_id
+    }))
+
 
+def _write_part(file_path: str, content: bytes):
+    """Write one decoded TMDL part to disk."""
+    with open(file_path, 'wb') as f:
+        f.write(content)
 
-def create_model_folder(container_path: Path, safe_name: str, definition: dict):
-    """Create .SemanticModel folder with TMDL definition."""
-    model_folder = container_path / f"{safe_name}.SemanticModel"
+
+def create_model_folder(ctx: ExportContext, parts: Iterable[dict]) -> int:
+    """Create .SemanticModel folder with TMDL definition; returns the number of parts decoded."""
+    model_folder = ctx.model_folder
     model_folder.mkdir(parents=True, exist_ok=True)
 
     # .platform file
-    with open(model_folder / '.platform', 'w', encoding='utf-8') as f:
-        json.dump({
-            "$schema": "https://developer.microsoft.com/json-schemas/fabric/gitIntegration/platformProperties/2.0.0/schema.json",
-            "metadata": {
-                "type": "SemanticModel",
-                "displayName": safe_name
-            },
-            "config": {
-                "version": "2.0",
-                "logicalId": str(uuid.uuid4())
-            }
-        }, f, indent=2)
+    (model_folder / '.platform').write_bytes(_jdumps({
+        "$schema": _SCHEMA_PLATFORM,
+        "metadata": {
+            "type": "SemanticModel",
+            "displayName": ctx.safe_name
+        },
+        "config": {
+            "version": "2.0",
+            "logicalId": ctx.model_logical_id
+        }
+    }))
 
     # definition.pbism
-    with open(model_folder / 'definition.pbism', 'w', encoding='utf-8') as f:
-        json.dump({
-            "$schema": "https://developer.microsoft.com/json-schemas/fabric/item/semanticModel/definitionProperties/1.0.0/schema.json",
-            "version": "4.0",
-            "settings": {}
-        }, f, indent=2)
+    (model_folder / 'definition.pbism').write_bytes(_jdumps(_PBISM_TEMPLATE))
 
     # .pbi folder
     pbi_folder = model_folder / ".pbi"
     pbi_folder.mkdir(parents=True, exist_ok=True)
 
-    with open(pbi_folder / "editorSettings.json", "w", encoding="utf-8") as f:
-        json_str = json.dumps({
-            "$schema": "https://developer.microsoft.com/json-schemas/fabric/item/semanticModel/editorSettings/1.0.0/schema.json",
-            "autodetectRelationships": True,
-            "parallelQueryLoading": True
-        }, indent=2)
-        json_str = json_str.replace(': True', ': true').replace(': False', ': false')
-        f.write(json_str)
+    (pbi_folder / "editorSettings.json").write_bytes(_jdumps(_EDITOR_SETTINGS_TEMPLATE))
+
+    # Write TMDL parts as they are decoded, so parsing and decoding on this
+    # thread overlap with the file writes on the pool
+    # Plain string paths keep Path object churn out of this per-part loop
+    model_dir = os.fspath(model_folder)
+    part_count = 0
+    folders = set()
 
-    # Write TMDL parts
-    tmdl_parts = parse_tmdl_definition(definition)
+    with ThreadPoolExecutor(max_workers=WRITE_WORKERS) as executor:
+        futures = []
+        for part_path, content in iter_tmdl_parts(parts):
+            part_count += 1
+            if part_path == '.platform':
+                continue
 
-    for part_path, content in tmdl_parts.items():
-        if part_path == '.platform':
-            continue
+            file_path = os.path.join(model_dir, part_path)
 
-        file_path = model_folder / part_path
-        file_path.parent.mkdir(parents=True, exist_ok=True)
+            # Create each distinct folder once, on this thread, before the
+            # part is handed to a writer so mkdir never races
+            folder = os.path.dirname(file_path)
+            if folder not in folders:
+                os.makedirs(folder, exist_ok=True)
+                folders.add(folder)
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(content)
+            futures.append(executor.submit(_write_part, file_path, content))
 
-    print(f"  Wrote {len(tmdl_parts)} TMDL parts")
+        for future in as_completed(futures):
+            future.result()
+
+    return part_count
 
 
 #endregion
@@ -362,6 +607,8 @@ def create_model_folder(container_path: Path, safe_name: str, definition: dict):
 
 
 def main():
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Export Fabric semantic model as PBIP format",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -374,6 +621,8 @@ Examples:
 
     parser.add_argument("path", help="Model path: Workspace.Workspace/Model.SemanticModel")
     parser.add_argument("-o", "--output", required=True, help="Output directory")
+    parser.add_argument("--verbose", action="store_true",
+                        help="Print progress while exporting, not just the final summary")
 
     args = parser.parse_args()
 
@@ -388,8 +637,10 @@ Examples:
     output_path = Path(args.output)
 
     # Get and export definition
-    definition = get_model_definition(full_path)
-    create_pbip_structure(definition, output_path, display_name)
+    if args.verbose:
+        print("Fetching model definition...")
+    parts = get_model_parts(full_path)
+    create_pbip_structure(parts, output_path, display_name, verbose=args.verbose)
 
 
 if __name__ == "__main__":
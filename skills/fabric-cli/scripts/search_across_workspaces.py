@@ -49,6 +49,15 @@ COMMON PATTERNS:
   # Sort by last visited (find stale items)
   python3 datahub_search.py --type Model --sort last-visited --sort-order asc
 
+  # Fetch several pages of results in parallel (up to 3000 items)
+  python3 datahub_search.py --type Model --page-size 1000 --pages 3
+
+  # Search every region at once (results de-duplicated by item id)
+  python3 datahub_search.py --type Model --region all
+
+  # Responses are cached for an hour in ~/.cache/datahub_search; force fresh results
+  python3 datahub_search.py --type Model --no-cache
+
 DATE FILTERS:
   --visited-since / --not-visited-since    When user last opened item
   --refreshed-since / --not-refreshed-since When data was last refreshed (models)
@@ -75,13 +84,54 @@ Usage:
 """
 
 import argparse
+import base64
+import bisect
+import functools
+import gzip
+import hashlib
 import json
+import os
 import subprocess
 import sys
+import tempfile
+import time
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from importlib.util import find_spec
+from itertools import chain, compress
+from pathlib import Path
+from types import MappingProxyType
+from requests.adapters import HTTPAdapter
 from typing import Dict, List, Optional, Any
 
+# The heavier optional dependencies below are only located here and imported where
+# they are used, so quick runs (--list-types, small searches) don't pay their import time
+
+# Optional: httpx lets large fan-outs run on one thread with asyncio (and HTTP/2 if h2 is installed)
+HTTPX_AVAILABLE = find_spec("httpx") is not None
+HTTP2_AVAILABLE = find_spec("h2") is not None
+
+# Optional: azure-identity gets tokens in-process for service principals (AZURE_* env vars)
+AZURE_IDENTITY_AVAILABLE = find_spec("azure") is not None and find_spec("azure.identity") is not None
+
+# Optional: numpy compares date columns in bulk for large result sets
+NUMPY_AVAILABLE = find_spec("numpy") is not None
+
+# Optional: orjson is a much faster JSON encoder/decoder than the stdlib
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional: ijson parses large responses incrementally instead of buffering the whole body
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 
 #region Configuration
 
@@ -104,7 +154,7 @@ REGIONS = {
 
 # Item types supported by DataHub API
 # IMPORTANT: For semantic models use "Model", for dataflows use "DataFlow"
-ITEM_TYPES = {
+ITEM_TYPES = MappingProxyType({
     # Reports & Dashboards
     "PowerBIReport": {"trident": "report", "category": "Reports", "desc": "Power BI reports (.pbix)"},
     "Report": {"trident": "report", "category": "Reports", "desc": "Alias for PowerBIReport"},
@@ -171,10 +221,96 @@ ITEM_TYPES = {
     # Configuration
     "Environment": {"trident": "Environment", "category": "Config", "desc": "Spark environments"},
     "Variables": {"trident": "Variables", "category": "Config", "desc": "Variable groups"},
-}
+})
+
+# Flattened lookups precomputed from ITEM_TYPES (read-only, like ITEM_TYPES itself)
+_ITEM_TO_TRIDENT = MappingProxyType({name: info["trident"] for name, info in ITEM_TYPES.items()})
+_ITEM_TO_CATEGORY = MappingProxyType({name: info["category"] for name, info in ITEM_TYPES.items()})
+
+
+def _build_category_index() -> tuple:
+    """Group ITEM_TYPES as sorted (category, sorted ((name, desc), ...)) pairs for --list-types."""
+    by_category = {}
+    for name, info in ITEM_TYPES.items():
+        by_category.setdefault(info["category"], []).append((name, info.get("desc", "")))
+    return tuple((cat, tuple(sorted(types))) for cat, types in sorted(by_category.items()))
+
+
+# Listing order for --list-types / --list-regions, fixed once since both tables are static
+_ITEM_TYPES_BY_CATEGORY = _build_category_index()
+_SORTED_REGIONS = tuple(sorted(REGIONS.items()))
 
 DEFAULT_REGION = "west-europe"
 
+# --region value that searches every region in REGIONS
+ALL_REGIONS = "all"
+
+# Upper bound on concurrent DataHub requests (one per region/page combination)
+MAX_WORKERS = 16
+
+# Upper bound on concurrent connections when fanning out with httpx
+MAX_ASYNC_CONNECTIONS = 64
+
+# On-disk cache of DataHub responses, keyed by signed-in account, region and request payload
+CACHE_DIR = Path.home() / ".cache" / "datahub_search"
+DEFAULT_CACHE_TTL = 3600
+
+# Power BI API scope for azure-identity credentials
+POWERBI_SCOPE = "https://analysis.windows.net/powerbi/api/.default"
+
+# Access token from az, reused until shortly before it expires and only for the
+# account it was issued to
+TOKEN_CACHE_FILE = CACHE_DIR / "token.json"
+TOKEN_EXPIRY_MARGIN = 60
+
+# Item fields read by the filters, sorting and output formatting; everything else is dropped
+FIELDS_USED = (
+    "displayName",
+    "name",
+    "workspaceName",
+    "workspaceObjectId",
+    "objectId",
+    "lastVisitedTimeUTC",
+    "lastRefreshTime",
+    "modifiedDate",
+    "ownerUser",
+    "artifact",
+    "isDiscoverable",
+)
+
+# Below this many rows the plain Python date filters are faster than building numpy arrays
+NUMPY_MIN_ROWS = 500
+
+# Rows apply_filters samples to measure each filter's selectivity
+SELECTIVITY_SAMPLE = 256
+
+# Distinct timestamp strings remembered by the date parsers
+DATE_CACHE_SIZE = 4096
+
+# Table output row: Name, Workspace, Last Visited, Owner
+TABLE_ROW_FORMAT = "{:<35} {:<22} {:<12} {:<20}"
+
+# artifact.storageMode codes (Direct Lake is flagged separately by directLakeMode)
+STORAGE_MODE_CODES = {"import": 1, "directquery": 2}
+
+#endregion
+
+
+#region JSON
+
+def _jloads(data):
+    """Parse JSON from str or bytes, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _jdumps_bytes(obj) -> bytes:
+    """Serialize to 2-space indented UTF-8 JSON bytes (orjson produces bytes natively)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
 #endregion
 
 
@@ -184,12 +320,21 @@ def get_fabric_token() -> Optional[str]:
     """
     Get Fabric access token using Azure CLI.
 
+    Uses a cached token while it is valid, then a service principal from the
+    AZURE_* environment variables if azure-identity is installed, then az.
+
     Returns:
         Access token string or None if failed
 
     Requires:
         Azure CLI installed and logged in (az login)
     """
+    # Starting az costs far more than the search itself, so reuse a still-valid token
+    identity = _environment_identity() if _environment_configured() else _az_identity()
+    token = _read_cached_token(identity) or _get_environment_token()
+    if token:
+        return token
+
     try:
         result = subprocess.run(
             ["az", "account", "get-access-token", "--resource", "https://analysis.windows.net/powerbi/api"],
@@ -199,8 +344,11 @@ def get_fabric_token() -> Optional[str]:
         )
 
         if result.returncode == 0:
-            data = json.loads(result.stdout)
-            return data.get("accessToken")
+            data = _jloads(result.stdout)
+            token = data.get("accessToken")
+            if token:
+                _write_cached_token(token, data, _az_identity())
+            return token
 
         print("Error: Azure CLI not authenticated. Run 'az login' first.", file=sys.stderr)
         return None
@@ -215,18 +363,106 @@ def get_fabric_token() -> Optional[str]:
         print(f"Error getting token: {e}", file=sys.stderr)
         return None
 
+
+def _environment_configured() -> bool:
+    """Whether a service principal is configured via AZURE_* environment variables and usable."""
+    return AZURE_IDENTITY_AVAILABLE and bool(os.environ.get("AZURE_CLIENT_ID"))
+
+
+def _environment_identity() -> str:
+    """Tenant and client ID of the service principal in the AZURE_* environment variables."""
+    return f"sp:{os.environ.get('AZURE_TENANT_ID', '')}/{os.environ.get('AZURE_CLIENT_ID', '')}"
+
+
+def _az_identity() -> Optional[str]:
+    """
+    Tenant and user of az's current account (as `az account show` reports), without starting az.
+
+    Returns:
+        "tenant/user" from the default account in az's profile, or None if it cannot be read
+    """
+    config_dir = Path(os.environ.get("AZURE_CONFIG_DIR") or Path.home() / ".azure")
+    try:
+        # az writes this file with a UTF-8 BOM
+        profile = json.loads((config_dir / "azureProfile.json").read_text(encoding="utf-8-sig"))
+        account = next(sub for sub in profile["subscriptions"] if sub.get("isDefault"))
+        return f"{account['tenantId']}/{account['user']['name']}"
+    except (OSError, ValueError, KeyError, TypeError, StopIteration):
+        return None
+
+
+def _get_environment_token() -> Optional[str]:
+    """Get a token in-process for a service principal configured via AZURE_* environment variables."""
+    if not _environment_configured():
+        return None
+    from azure.identity import EnvironmentCredential
+    try:
+        access = EnvironmentCredential().get_token(POWERBI_SCOPE)
+    except Exception as e:
+        print(f"Warning: environment credential failed, falling back to Azure CLI: {e}", file=sys.stderr)
+        return None
+    _write_cached_token(access.token, {"expires_on": access.expires_on}, _environment_identity())
+    return access.token
+
+
+def _read_cached_token(identity: Optional[str]) -> Optional[str]:
+    """Return the cached access token if it belongs to identity and is not about to expire."""
+    if identity is None:
+        return None
+    try:
+        cached = _jloads(TOKEN_CACHE_FILE.read_bytes())
+        if cached["identity"] == identity and time.time() < cached["expires_on"] - TOKEN_EXPIRY_MARGIN:
+            return cached["accessToken"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def _write_cached_token(token: str, data: Dict, identity: Optional[str]) -> None:
+    """Cache an access token with the account it was issued to (readable by the current user only)."""
+    if identity is None:
+        return
+
+    # Newer az versions report expires_on as a POSIX timestamp; older ones only
+    # have expiresOn as a local time string
+    try:
+        if data.get("expires_on"):
+            expires_on = float(data["expires_on"])
+        else:
+            expires_on = datetime.fromisoformat(data["expiresOn"]).timestamp()
+    except (KeyError, TypeError, ValueError):
+        return
+
+    try:
+        TOKEN_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(TOKEN_CACHE_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump({"accessToken": token, "expires_on": expires_on, "identity": identity}, f)
+        os.chmod(TOKEN_CACHE_FILE, 0o600)
+    except OSError:
+        pass
+
 #endregion
 
 
 #region DataHub API
 
+@functools.lru_cache(maxsize=1)
+def _get_session() -> requests.Session:
+    """Shared HTTP session so DataHub calls reuse pooled keep-alive connections."""
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=32))
+    return session
+
+
 def search_datahub(
     token: str,
     item_types: List[str],
     region: str = DEFAULT_REGION,
     workspace_id: Optional[str] = None,
     page_size: int = 100,
-    page_number: int = 1
+    page_number: int = 1,
+    cache_ttl: int = 0
 ) -> Dict[str, Any]:
     """
     Search DataHub V2 API for items across all workspaces.
@@ -238,6 +474,7 @@ def search_datahub(
         workspace_id: Optional workspace GUID to filter results
         page_size: Results per page, max 1000 (default: 100)
         page_number: Page to retrieve, 1-indexed (default: 1)
+        cache_ttl: Serve/store responses in the disk cache for this many seconds (default: 0, off)
 
     Returns:
         Dict with keys:
@@ -248,17 +485,76 @@ def search_datahub(
             host: API host used
             error: Error message (if not success)
     """
+    request = _build_datahub_request(token, item_types, region, workspace_id, page_size, page_number)
+    if not request:
+        return {"success": False, "error": f"Unknown region: {region}. Use --list-regions to see options."}
+    url, headers, payload = request
+
+    if cache_ttl and (cached := _cache_read(token, region, payload, cache_ttl)) is not None:
+        return cached
+
+    try:
+        response = _get_session().post(url, headers=headers, json=payload, timeout=60, stream=IJSON_AVAILABLE)
+        with response:
+            result = _datahub_result(response, region, streamed=IJSON_AVAILABLE)
+        return _cache_write(token, region, payload, result, cache_ttl)
+    except requests.exceptions.Timeout:
+        return {"success": False, "error": "Request timed out (60s)", "region": region}
+    except Exception as e:
+        return {"success": False, "error": str(e), "region": region}
+
+
+async def search_datahub_async(
+    client: "httpx.AsyncClient",
+    token: str,
+    item_types: List[str],
+    region: str = DEFAULT_REGION,
+    workspace_id: Optional[str] = None,
+    page_size: int = 100,
+    page_number: int = 1,
+    cache_ttl: int = 0
+) -> Dict[str, Any]:
+    """
+    Async variant of search_datahub using a shared httpx.AsyncClient.
+
+    Args:
+        client: httpx.AsyncClient to send the request with
+        (remaining arguments and return value as for search_datahub)
+    """
+    import httpx
+
+    request = _build_datahub_request(token, item_types, region, workspace_id, page_size, page_number)
+    if not request:
+        return {"success": False, "error": f"Unknown region: {region}. Use --list-regions to see options."}
+    url, headers, payload = request
+
+    if cache_ttl and (cached := _cache_read(token, region, payload, cache_ttl)) is not None:
+        return cached
+
+    try:
+        response = await client.post(url, headers=headers, json=payload, timeout=60)
+        return _cache_write(token, region, payload, _datahub_result(response, region), cache_ttl)
+    except httpx.TimeoutException:
+        return {"success": False, "error": "Request timed out (60s)", "region": region}
+    except Exception as e:
+        return {"success": False, "error": str(e), "region": region}
+
+
+def _build_datahub_request(
+    token: str,
+    item_types: List[str],
+    region: str,
+    workspace_id: Optional[str],
+    page_size: int,
+    page_number: int
+) -> Optional[tuple]:
+    """Build (url, headers, payload) for a DataHub V2 search, or None for an unknown region."""
     host = REGIONS.get(region)
     if not host:
-        return {"success": False, "error": f"Unknown region: {region}. Use --list-regions to see options."}
+        return None
 
-    # Build trident types from our mapping
-    trident_types = []
-    for item_type in item_types:
-        if item_type in ITEM_TYPES:
-            trident_types.append(ITEM_TYPES[item_type]["trident"])
-        else:
-            trident_types.append(item_type.lower())
+    # Build trident types from our mapping (unknown types are passed through lowercased)
+    trident_types = [_ITEM_TO_TRIDENT.get(item_type) or item_type.lower() for item_type in item_types]
 
     # Build API filters
     filters = []
@@ -285,29 +581,219 @@ def search_datahub(
     }
 
     url = f"https://{host}/metadata/datahub/V2/artifacts"
+    return url, headers, payload
+
+
+def _datahub_result(response, region: str, streamed: bool = False) -> Dict[str, Any]:
+    """
+    Convert a requests/httpx response into the search_datahub result dict.
+
+    Args:
+        response: Response to read
+        region: Region the request was sent to
+        streamed: True if response is a streamed requests response to parse with ijson
+    """
+    if response.status_code == 200:
+        items = _read_items(response, streamed)
+        return {
+            "success": True,
+            "items": items,
+            "count": len(items),
+            "region": region,
+            "host": REGIONS[region]
+        }
+    else:
+        return {
+            "success": False,
+            "error": f"HTTP {response.status_code}: {response.text[:200]}",
+            "region": region
+        }
+
+
+def _read_items(response, streamed: bool) -> List[Dict]:
+    """Read the item list from a DataHub response, projected onto FIELDS_USED."""
+    # The API has no field selection, so project here to keep only what is used downstream
+    if streamed:
+        # Parse item by item straight off the socket; the full body is never held in memory
+        response.raw.decode_content = True
+        return [
+            {key: item[key] for key in FIELDS_USED if key in item}
+            for item in ijson.items(response.raw, "item", use_float=True)
+        ]
+    items = _jloads(response.content)
+    if not isinstance(items, list):
+        return []
+    return [{key: item[key] for key in FIELDS_USED if key in item} for item in items]
+
+
+@functools.lru_cache(maxsize=4)
+def _token_identity(token: str) -> str:
+    """Tenant and object ID claims of an access token, identifying the signed-in account."""
+    try:
+        claims = token.split(".")[1]
+        claims = _jloads(base64.urlsafe_b64decode(claims + "=" * (-len(claims) % 4)))
+        return f"{claims['tid']}/{claims['oid']}"
+    except (IndexError, ValueError, KeyError, TypeError):
+        # Not a readable JWT: key on the token itself so no other account's results are reused
+        return hashlib.sha1(token.encode()).hexdigest()
+
 
+def _cache_path(token: str, region: str, payload: Dict) -> Path:
+    """Cache file for the token's account and a region/payload pair."""
+    key_data = json.dumps([_token_identity(token), payload], sort_keys=True).encode()
+    key = hashlib.sha1(key_data).hexdigest()
+    return CACHE_DIR / region / f"{key}.json.gz"
+
+
+def _cache_read(token: str, region: str, payload: Dict, ttl: int) -> Optional[Dict[str, Any]]:
+    """Return the cached result for this request if it is younger than ttl seconds."""
+    path = _cache_path(token, region, payload)
+    try:
+        age = time.time() - path.stat().st_mtime
+        if age > ttl:
+            return None
+        with gzip.open(path, "rb") as f:
+            items = _jloads(f.read())
+    except (OSError, EOFError, ValueError):
+        return None
+    print(f"Note: using cached {region} results from {age:.0f}s ago; --cache-ttl 0 to refresh",
+          file=sys.stderr)
+    return {
+        "success": True,
+        "items": items,
+        "count": len(items),
+        "region": region,
+        "host": REGIONS[region],
+        "cached": True
+    }
+
+
+def _cache_write(token: str, region: str, payload: Dict, result: Dict[str, Any],
+                 ttl: int) -> Dict[str, Any]:
+    """Store a successful result's items in the cache (atomically) and return the result."""
+    if not ttl or not result["success"]:
+        return result
+    path = _cache_path(token, region, payload)
     try:
-        response = requests.post(url, headers=headers, json=payload, timeout=60)
-
-        if response.status_code == 200:
-            items = response.json()
-            return {
-                "success": True,
-                "items": items if isinstance(items, list) else [],
-                "count": len(items) if isinstance(items, list) else 0,
-                "region": region,
-                "host": host
-            }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False) as tmp:
+            with gzip.open(tmp, "wt", encoding="utf-8") as f:
+                json.dump(result["items"], f)
+        os.replace(tmp.name, path)
+    except OSError as e:
+        print(f"Warning: could not write cache {path}: {e}", file=sys.stderr)
+    return result
+
+
+async def _gather_datahub_async(token: str, item_types: List[str], jobs: List[tuple],
+                                workspace_id: Optional[str], page_size: int,
+                                cache_ttl: int) -> List[Dict[str, Any]]:
+    """Run one search_datahub_async per (region, page) job on a single AsyncClient."""
+    import asyncio
+    import httpx
+
+    limits = httpx.Limits(max_connections=MAX_ASYNC_CONNECTIONS)
+    async with httpx.AsyncClient(http2=HTTP2_AVAILABLE, limits=limits) as client:
+        return await asyncio.gather(*(
+            search_datahub_async(client, token, item_types, region, workspace_id, page_size, page, cache_ttl)
+            for region, page in jobs
+        ))
+
+
+def search_datahub_many(
+    token: str,
+    item_types: List[str],
+    regions: List[str],
+    pages: int = 1,
+    workspace_id: Optional[str] = None,
+    page_size: int = 100,
+    cache_ttl: int = 0
+) -> Dict[str, Any]:
+    """
+    Search several regions and/or pages concurrently and merge the results.
+
+    Args:
+        token: Azure AD access token for Power BI API
+        item_types: List of item type names (e.g., ["Model", "PowerBIReport"])
+        regions: Region keys from REGIONS dict
+        pages: Number of pages to fetch per region, starting at 1 (default: 1)
+        workspace_id: Optional workspace GUID to filter results
+        page_size: Results per page, max 1000 (default: 100)
+        cache_ttl: Disk cache lifetime in seconds, 0 to bypass the cache (default: 0)
+
+    Returns:
+        Dict with keys:
+            success: bool (True if at least one request succeeded)
+            items: Merged item dicts, in region then page order, each tagged with its "region"
+            count: Number of items returned
+            regions: Regions that answered successfully
+            errors: Error messages from failed requests
+    """
+    jobs = [(region, page) for region in regions for page in range(1, pages + 1)]
+
+    # Each POST is a network round-trip, so overlap them: on one asyncio thread
+    # with httpx when it is installed, otherwise on a thread pool with requests
+    if HTTPX_AVAILABLE and len(jobs) > 1:
+        import asyncio
+        results = asyncio.run(_gather_datahub_async(token, item_types, jobs, workspace_id, page_size, cache_ttl))
+    else:
+        with ThreadPoolExecutor(max_workers=max(1, min(MAX_WORKERS, len(jobs)))) as executor:
+            futures = [
+                executor.submit(search_datahub, token, item_types, region, workspace_id, page_size, page, cache_ttl)
+                for region, page in jobs
+            ]
+        results = [future.result() for future in futures]
+
+    items = []
+    ok_regions = []
+    errors = []
+    for (region, page), result in zip(jobs, results):
+        if result["success"]:
+            for item in result["items"]:
+                item["region"] = region
+            items.extend(result["items"])
+            if region not in ok_regions:
+                ok_regions.append(region)
         else:
-            return {
-                "success": False,
-                "error": f"HTTP {response.status_code}: {response.text[:200]}",
-                "region": region
-            }
-    except requests.exceptions.Timeout:
-        return {"success": False, "error": "Request timed out (60s)", "region": region}
-    except Exception as e:
-        return {"success": False, "error": str(e), "region": region}
+            errors.append(f"{region} page {page}: {result['error']}")
+
+    return {
+        "success": bool(ok_regions),
+        "items": items,
+        "count": len(items),
+        "regions": ok_regions,
+        "errors": errors,
+    }
+
+
+def search_all_regions(token: str, item_types: List[str], **kwargs) -> Dict[str, Any]:
+    """
+    Search every region in REGIONS concurrently, merging and de-duplicating the results.
+
+    Args:
+        token: Azure AD access token for Power BI API
+        item_types: List of item type names (e.g., ["Model", "PowerBIReport"])
+        **kwargs: pages, workspace_id, page_size, cache_ttl as for search_datahub_many
+
+    Returns:
+        search_datahub_many result; an item returned by several regions is kept
+        once (by objectId), tagged with the first region in REGIONS order
+    """
+    result = search_datahub_many(token, item_types, list(REGIONS), **kwargs)
+
+    seen = set()
+    unique = []
+    for item in result["items"]:
+        object_id = item.get("objectId")
+        if object_id:
+            if object_id in seen:
+                continue
+            seen.add(object_id)
+        unique.append(item)
+
+    result["items"] = unique
+    result["count"] = len(unique)
+    return result
 
 #endregion
 
@@ -327,6 +813,7 @@ def apply_filters(
     not_updated_since: Optional[str] = None,
     storage_mode: Optional[str] = None,
     capacity_sku: Optional[str] = None,
+    date_indexes: Optional[Dict[str, "DateIndex"]] = None,
 ) -> List[Dict]:
     """
     Apply multiple filters to items list.
@@ -344,160 +831,228 @@ def apply_filters(
         not_updated_since: Only items NOT modified since this date
         storage_mode: Filter by storage mode (import, directquery, directlake)
         capacity_sku: Filter by capacity SKU (F2, F64, PP, etc.)
+        date_indexes: Optional DateIndex per date field ("visited", "refreshed",
+            "modified") built over these items; used instead of parsing dates when
+            the same items are filtered repeatedly
 
     Returns:
         Filtered list of items
     """
-    result = items
+    _prepare(items)
+
+    # Filters run column-at-a-time: each is (cost tier, column, test) where column
+    # extracts one flat value per item and test maps that whole column to a keep-mask.
+    # Tiers: 0 = int/flag compare, 1 = substring match, 2 = date parsing. Running the
+    # cheap tiers first means expensive columns are only built for surviving rows.
+    filters = []
 
-    # Name filter
+    if storage_mode:
+        mode_lower = storage_mode.lower()
+        if mode_lower == "directlake":
+            # compress() only needs truthiness, so the flag column is its own mask
+            filters.append((0, lambda item: item.get("artifact", {}).get("directLakeMode", False),
+                            lambda col: col))
+        else:
+            want_sm = STORAGE_MODE_CODES.get(mode_lower)
+            if want_sm is None:
+                # Unknown mode: nothing can match, so skip building any columns
+                return []
+            filters.append((0, lambda item: item.get("artifact", {}).get("storageMode"),
+                            lambda col: [v == want_sm for v in col]))
+
+    # Case-insensitive substring matches run against the lowercased columns _prepare
+    # keeps for sorting (_name_lc, _ws_lc, _owner_lc), so the common fields are never
+    # re-lowered here; fallback fields are only lowered when the primary one misses
     if name_filter:
         name_lower = name_filter.lower()
-        result = [
-            item for item in result
-            if name_lower in item.get("displayName", "").lower()
-            or name_lower in item.get("name", "").lower()
-        ]
+        filters.append((1, lambda item: (item["_name_lc"], item.get("name") or ""),
+                        lambda col: [name_lower in display or name_lower in name.lower() for display, name in col]))
 
-    # Workspace filter
     if workspace_filter:
         ws_lower = workspace_filter.lower()
-        result = [
-            item for item in result
-            if ws_lower in item.get("workspaceName", "").lower()
-        ]
+        filters.append((1, lambda item: item["_ws_lc"],
+                        lambda col: [ws_lower in v for v in col]))
 
-    # Owner filter
     if owner_filter:
         owner_lower = owner_filter.lower()
-        result = [
-            item for item in result
-            if owner_lower in item.get("ownerUser", {}).get("emailAddress", "").lower()
-            or owner_lower in item.get("ownerUser", {}).get("givenName", "").lower()
-            or owner_lower in item.get("ownerUser", {}).get("familyName", "").lower()
-        ]
+        def owner_fields(item: Dict) -> tuple:
+            owner = item.get("ownerUser") or {}
+            return (item["_owner_lc"], owner.get("givenName") or "", owner.get("familyName") or "")
+        filters.append((1, owner_fields,
+                        lambda col: [owner_lower in email or owner_lower in given.lower() or owner_lower in family.lower()
+                                     for email, given, family in col]))
 
-    # Visited since filter
-    if visited_since:
-        try:
-            since_date = datetime.strptime(visited_since, "%Y-%m-%d")
-            result = [
-                item for item in result
-                if item.get("lastVisitedTimeUTC") and
-                datetime.strptime(item["lastVisitedTimeUTC"][:10], "%Y-%m-%d") >= since_date
-            ]
-        except ValueError:
-            print(f"Warning: Invalid date format '{visited_since}', use YYYY-MM-DD", file=sys.stderr)
+    if capacity_sku:
+        sku_upper = capacity_sku.upper()
+        filters.append((1, lambda item: item.get("artifact", {}).get("sharedFromEnterpriseCapacitySku") or "",
+                        lambda col: [sku_upper in v.upper() for v in col]))
+
+    # One raw-string column per timestamp, so it is parsed at most once however many bounds use it
+    date_filters = (
+        # When user last opened item
+        ("visited", lambda item: item.get("lastVisitedTimeUTC"), _parse_iso_date, visited_since, not_visited_since),
+        # Models: lastRefreshTime, notebooks: lastUpdatedDate
+        ("refreshed", lambda item: item["_refresh_raw"], _parse_odata_date, refreshed_since, not_refreshed_since),
+        # When the item definition was modified
+        ("modified", lambda item: item.get("modifiedDate"), _parse_odata_date, updated_since, not_updated_since),
+    )
+    for field, get_date, parse, since, not_since in date_filters:
+        after = _parse_since(since)
+        before = _parse_since(not_since)
+        if not (after or before):
+            continue
+        index = (date_indexes or {}).get(field)
+        if index is not None:
+            # Prebuilt index: the matching items come from a bisect, so this is a cheap identity check
+            matching = {id(item) for item in index.range(after, before)}
+            filters.append((0, id, lambda col, matching=matching: [key in matching for key in col]))
+        else:
+            filters.append((2, get_date, _date_range_mask(parse, after, before)))
 
-    # Not visited since filter (stale items)
-    if not_visited_since:
-        try:
-            since_date = datetime.strptime(not_visited_since, "%Y-%m-%d")
-            result = [
-                item for item in result
-                if item.get("lastVisitedTimeUTC") and
-                datetime.strptime(item["lastVisitedTimeUTC"][:10], "%Y-%m-%d") < since_date
-            ]
-        except ValueError:
-            print(f"Warning: Invalid date format '{not_visited_since}', use YYYY-MM-DD", file=sys.stderr)
+    filters.sort(key=lambda f: f[0])
+    if len(filters) > 1 and len(items) > SELECTIVITY_SAMPLE:
+        filters = _order_by_selectivity(filters, items[:SELECTIVITY_SAMPLE])
+    rows = items
+    for _, column, test in filters:
+        # compress() selects by mask in C, without a Python-level zip/if per row
+        rows = list(compress(rows, test([column(item) for item in rows])))
+    return rows if filters else list(items)
 
-    # Refreshed since filter (models: lastRefreshTime, notebooks: lastUpdatedDate)
-    if refreshed_since:
-        try:
-            since_date = datetime.strptime(refreshed_since, "%Y-%m-%d")
-            def get_refresh_datetime(item):
-                refresh_str = item.get("lastRefreshTime")
-                if refresh_str:
-                    return _parse_odata_date(refresh_str)
-                artifact = item.get("artifact", {})
-                refresh_str = artifact.get("LastRefreshTime") or artifact.get("lastRefreshTime")
-                if refresh_str:
-                    return _parse_odata_date(refresh_str)
-                updated = artifact.get("lastUpdatedDate")
-                if updated:
-                    return _parse_odata_date(updated)
-                return None
-            result = [
-                item for item in result
-                if get_refresh_datetime(item) and get_refresh_datetime(item) >= since_date
-            ]
-        except ValueError:
-            print(f"Warning: Invalid date format '{refreshed_since}', use YYYY-MM-DD", file=sys.stderr)
 
-    # Not refreshed since filter (stale data)
-    if not_refreshed_since:
-        try:
-            since_date = datetime.strptime(not_refreshed_since, "%Y-%m-%d")
-            def get_refresh_datetime(item):
-                refresh_str = item.get("lastRefreshTime")
-                if refresh_str:
-                    return _parse_odata_date(refresh_str)
-                artifact = item.get("artifact", {})
-                refresh_str = artifact.get("LastRefreshTime") or artifact.get("lastRefreshTime")
-                if refresh_str:
-                    return _parse_odata_date(refresh_str)
-                updated = artifact.get("lastUpdatedDate")
-                if updated:
-                    return _parse_odata_date(updated)
-                return None
-            result = [
-                item for item in result
-                if get_refresh_datetime(item) and get_refresh_datetime(item) < since_date
-            ]
-        except ValueError:
-            print(f"Warning: Invalid date format '{not_refreshed_since}', use YYYY-MM-DD", file=sys.stderr)
+class DateIndex:
+    """
+    Items bucketed by the day of one date field, for repeated range filters over the same items.
 
-    # Updated since filter (when item definition was modified)
-    if updated_since:
-        try:
-            since_date = datetime.strptime(updated_since, "%Y-%m-%d")
-            result = [
-                item for item in result
-                if _parse_odata_date(item.get("modifiedDate")) and
-                _parse_odata_date(item.get("modifiedDate")) >= since_date
-            ]
-        except ValueError:
-            print(f"Warning: Invalid date format '{updated_since}', use YYYY-MM-DD", file=sys.stderr)
+    Building costs one parse per item, so this only pays off when the same item
+    list is filtered against several date bounds (e.g. exploring staleness cutoffs).
 
-    # Not updated since filter
-    if not_updated_since:
-        try:
-            since_date = datetime.strptime(not_updated_since, "%Y-%m-%d")
-            result = [
-                item for item in result
-                if _parse_odata_date(item.get("modifiedDate")) and
-                _parse_odata_date(item.get("modifiedDate")) < since_date
-            ]
-        except ValueError:
-            print(f"Warning: Invalid date format '{not_updated_since}', use YYYY-MM-DD", file=sys.stderr)
+    Example:
+        index = DateIndex.build(items, "modified")
+        stale = apply_filters(items, not_updated_since="2024-06-01", date_indexes={"modified": index})
+    """
 
-    # Storage mode filter
-    if storage_mode:
-        mode_lower = storage_mode.lower()
-        def matches_storage(item):
-            artifact = item.get("artifact", {})
-            sm = artifact.get("storageMode")
-            dl = artifact.get("directLakeMode", False)
-            if mode_lower == "import" and sm == 1:
-                return True
-            if mode_lower == "directquery" and sm == 2:
-                return True
-            if mode_lower == "directlake" and dl:
-                return True
-            return False
-        result = [item for item in result if matches_storage(item)]
-
-    # Capacity SKU filter
-    if capacity_sku:
-        sku_upper = capacity_sku.upper()
-        result = [
-            item for item in result
-            if sku_upper in item.get("artifact", {}).get("sharedFromEnterpriseCapacitySku", "").upper()
-        ]
+    # Date field name -> function returning that date for an item
+    FIELDS = {
+        "visited": lambda item: _parse_iso_date(item.get("lastVisitedTimeUTC")),
+        "refreshed": lambda item: _get_item_refresh_datetime(item),
+        "modified": lambda item: _parse_odata_date(item.get("modifiedDate")),
+    }
+
+    def __init__(self, items_by_day: Dict[int, List[Dict]]):
+        self.items_by_day = items_by_day
+        self.sorted_days = sorted(items_by_day)
+
+    @classmethod
+    def build(cls, items: List[Dict], field: str) -> "DateIndex":
+        """Index items by the day ordinal of a date field ("visited", "refreshed" or "modified")."""
+        get_date = cls.FIELDS[field]
+        items_by_day = {}
+        for item in items:
+            dt = get_date(item)
+            if dt:
+                items_by_day.setdefault(dt.toordinal(), []).append(item)
+        return cls(items_by_day)
+
+    def range(self, after: Optional[datetime] = None, before: Optional[datetime] = None) -> List[Dict]:
+        """Items dated on/after `after` and before `before` (both day-aligned bounds)."""
+        lo = bisect.bisect_left(self.sorted_days, after.toordinal()) if after else 0
+        hi = bisect.bisect_left(self.sorted_days, before.toordinal()) if before else len(self.sorted_days)
+        return list(chain.from_iterable(self.items_by_day[day] for day in self.sorted_days[lo:hi]))
 
-    return result
 
+def _order_by_selectivity(filters: List[tuple], sample: List[Dict]) -> List[tuple]:
+    """
+    Order filters within each cost tier by how many sample rows they keep.
+
+    Running the most selective test of a tier first shrinks the rows the
+    others in that tier (e.g. several substring matches) have to scan.
+    """
+    def kept(f: tuple) -> tuple:
+        tier, column, test = f
+        return tier, sum(map(bool, test([column(item) for item in sample])))
+    return sorted(filters, key=kept)
+
+
+def _date_range_mask(parse, after: Optional[datetime], before: Optional[datetime]):
+    """Build a column test keeping raw dates that parse to on/after `after` and before `before`."""
+    def in_range(col: List[Optional[str]]) -> List[bool]:
+        if NUMPY_AVAILABLE and len(col) >= NUMPY_MIN_ROWS:
+            mask = _np_date_range_mask(col, after, before, odata=parse is _parse_odata_date)
+            if mask is not None:
+                return mask
+        mask = []
+        for date_str in col:
+            dt = parse(date_str)
+            mask.append(dt is not None and (not after or dt >= after) and (not before or dt < before))
+        return mask
+    return in_range
+
+
+def _np_date_range_mask(col: List[Optional[str]], after: Optional[datetime], before: Optional[datetime],
+                        odata: bool) -> Optional[List[bool]]:
+    """
+    Range-test a column of raw dates with numpy, without building datetime objects.
 
+    /Date(ms)/ values are compared as epoch milliseconds against the bounds'
+    timestamps (the same instants _parse_odata_date's local times represent);
+    ISO values are compared by day. Returns None if a value needs the Python path.
+    """
+    import numpy as np
+
+    # Split the column into flat parallel arrays, one comprehension each: a
+    # /Date(ms)/ flag, epoch ms for those rows, and the ISO day (or NaT) for the rest
+    try:
+        if odata:
+            is_ms = [bool(s) and s[:6] == "/Date(" and s[-2:] == ")/" for s in col]
+            ms = np.array([int(s[6:-2]) if m else 0 for s, m in zip(col, is_ms)], dtype=np.int64)
+            days = np.array([s[:10] if s and not m else "NaT" for s, m in zip(col, is_ms)], dtype="datetime64[D]")
+        else:
+            days = np.array([s[:10] if s else "NaT" for s in col], dtype="datetime64[D]")
+    except (ValueError, OverflowError):
+        return None
+
+    keep = ~np.isnat(days)
+    if after:
+        keep &= days >= np.datetime64(after.date(), "D")
+    if before:
+        keep &= days < np.datetime64(before.date(), "D")
+    if odata:
+        keep_ms = np.array(is_ms, dtype=bool)
+        if after:
+            keep_ms &= ms >= int(after.timestamp() * 1000)
+        if before:
+            keep_ms &= ms < int(before.timestamp() * 1000)
+        keep |= keep_ms
+    return keep.tolist()
+
+
+def _parse_since(date_str: Optional[str]) -> Optional[datetime]:
+    """Parse a YYYY-MM-DD filter bound, warning and returning None if invalid."""
+    if not date_str:
+        return None
+    try:
+        return datetime.strptime(date_str, "%Y-%m-%d")
+    except ValueError:
+        print(f"Warning: Invalid date format '{date_str}', use YYYY-MM-DD", file=sys.stderr)
+        return None
+
+
+# Timestamps repeat heavily across items (e.g. models refreshed by the same
+# schedule), so each distinct string is parsed once; main() clears these per search
+@functools.lru_cache(maxsize=DATE_CACHE_SIZE)
+def _parse_iso_date(date_str: Optional[str]) -> Optional[datetime]:
+    """Parse the date part of an ISO timestamp (2025-11-01T12:00:00Z) to a naive midnight datetime."""
+    if not date_str:
+        return None
+    try:
+        # fromisoformat is implemented in C; only the date is kept, so the time and
+        # any Z/offset suffix (which fromisoformat rejects before 3.11) are sliced off
+        return datetime.fromisoformat(date_str[:10])
+    except ValueError:
+        return None
+
+
+@functools.lru_cache(maxsize=DATE_CACHE_SIZE)
 def _parse_odata_date(date_str: Optional[str]) -> Optional[datetime]:
     """Parse OData date format /Date(1234567890)/ to datetime."""
     if not date_str:
@@ -510,10 +1065,7 @@ def _parse_odata_date(date_str: Optional[str]) -> Optional[datetime]:
         except (ValueError, OSError):
             return None
     # Handle ISO format: 2025-11-01T12:00:00
-    try:
-        return datetime.strptime(date_str[:10], "%Y-%m-%d")
-    except ValueError:
-        return None
+    return _parse_iso_date(date_str)
 
 
 def _get_item_refresh_time(item: Dict) -> Optional[str]:
@@ -533,10 +1085,28 @@ def _get_item_refresh_time(item: Dict) -> Optional[str]:
 
 def _get_item_refresh_datetime(item: Dict) -> Optional[datetime]:
     """Get last refresh time as datetime for filtering."""
-    refresh_str = _get_item_refresh_time(item)
+    refresh_str = item["_refresh_raw"] if "_refresh_raw" in item else _get_item_refresh_time(item)
     return _parse_odata_date(refresh_str)
 
 
+def _prepare(items: List[Dict]) -> List[Dict]:
+    """
+    Attach values derived from each item that filtering, sorting and output share.
+
+    Adds _name_lc, _ws_lc and _owner_lc (lowercased sort keys) and _refresh_raw
+    (the refresh timestamp from whichever field the item type uses). Already
+    prepared items are skipped, so each stage can call this cheaply.
+    """
+    for item in items:
+        if "_refresh_raw" in item:
+            continue
+        item["_name_lc"] = (item.get("displayName") or "").lower()
+        item["_ws_lc"] = (item.get("workspaceName") or "").lower()
+        item["_owner_lc"] = ((item.get("ownerUser") or {}).get("emailAddress") or "").lower()
+        item["_refresh_raw"] = _get_item_refresh_time(item)
+    return items
+
+
 def sort_items(items: List[Dict], sort_by: str, sort_order: str = "desc") -> List[Dict]:
     """
     Sort items by specified field.
@@ -549,22 +1119,35 @@ def sort_items(items: List[Dict], sort_by: str, sort_order: str = "desc") -> Lis
     Returns:
         Sorted list
     """
-    reverse = sort_order.lower() != "asc"
-
-    if sort_by == "name":
-        return sorted(items, key=lambda x: x.get("displayName", "").lower(), reverse=reverse)
-    elif sort_by == "workspace":
-        return sorted(items, key=lambda x: x.get("workspaceName", "").lower(), reverse=reverse)
-    elif sort_by == "last-visited":
-        return sorted(items, key=lambda x: x.get("lastVisitedTimeUTC", ""), reverse=reverse)
-    elif sort_by == "last-refreshed":
-        return sorted(items, key=lambda x: _get_item_refresh_time(x) or "", reverse=reverse)
-    elif sort_by == "last-modified":
-        return sorted(items, key=lambda x: x.get("modifiedDate", ""), reverse=reverse)
-    elif sort_by == "owner":
-        return sorted(items, key=lambda x: x.get("ownerUser", {}).get("emailAddress", "").lower(), reverse=reverse)
-    else:
+    key = _SORT_KEYS.get(sort_by)
+    if key is None:
         return items
+    _prepare(items)
+    # sorted() computes each key once per item (decorate-sort-undecorate), not per comparison
+    return sorted(items, key=key, reverse=sort_order.lower() != "asc")
+
+
+def _date_sort_key(date_str: Optional[str], parse) -> tuple:
+    """
+    Sort key for a raw item date: (parsed datetime, raw string).
+
+    Parsing orders /Date(ms)/ and ISO values by time rather than as text, and the
+    raw string keeps ISO times within one day in order. Missing or unparseable
+    dates get datetime.min, so they sort last when descending.
+    """
+    return parse(date_str) or datetime.min, date_str or ""
+
+
+# --sort field -> sort key extractor (date parsers are memoized, so dates already
+# parsed while filtering are not parsed again)
+_SORT_KEYS = {
+    "name": lambda x: x["_name_lc"],
+    "workspace": lambda x: x["_ws_lc"],
+    "last-visited": lambda x: _date_sort_key(x.get("lastVisitedTimeUTC"), _parse_iso_date),
+    "last-refreshed": lambda x: _date_sort_key(x["_refresh_raw"], _parse_odata_date),
+    "last-modified": lambda x: _date_sort_key(x.get("modifiedDate"), _parse_odata_date),
+    "owner": lambda x: x["_owner_lc"],
+}
 
 #endregion
 
@@ -584,24 +1167,8 @@ def format_output(items: List[Dict], output_format: str = "table", show_fields:
         Formatted string for output
     """
     if output_format == "json":
-        # Clean JSON output - remove internal fields
-        cleaned = []
-        for item in items:
-            cleaned.append({
-                "name": item.get("displayName", item.get("name")),
-                "workspace": item.get("workspaceName"),
-                "workspaceId": item.get("workspaceObjectId"),
-                "id": item.get("objectId"),
-                "lastVisited": item.get("lastVisitedTimeUTC"),
-                "lastRefreshed": _get_refresh_time(item),
-                "lastModified": _get_modified_time(item),
-                "owner": item.get("ownerUser", {}).get("emailAddress"),
-                "ownerName": f"{item.get('ownerUser', {}).get('givenName', '')} {item.get('ownerUser', {}).get('familyName', '')}".strip(),
-                "storageMode": _get_storage_mode(item),
-                "capacitySku": item.get("artifact", {}).get("sharedFromEnterpriseCapacitySku"),
-                "isDiscoverable": item.get("isDiscoverable"),
-            })
-        return json.dumps(cleaned, indent=2)
+        # ASCII-escaped, so the text can be printed under any console code page
+        return json.dumps(_json_records(items), indent=2)
 
     if not items:
         return "No items found."
@@ -629,22 +1196,66 @@ def format_output(items: List[Dict], output_format: str = "table", show_fields:
             lines.append("-" * 60)
         return "\n".join(lines)
 
-    # Table format (default)
-    lines = []
-    lines.append(f"{'Name':<35} {'Workspace':<22} {'Last Visited':<12} {'Owner':<20}")
-    lines.append("-" * 92)
+    # Table format (default); the row template is parsed once, not per row
+    row_fmt = TABLE_ROW_FORMAT.format
+    lines = [row_fmt("Name", "Workspace", "Last Visited", "Owner"), "-" * 92]
 
     for item in items:
-        name = item.get("displayName", item.get("name", "Unknown"))[:34]
-        workspace = item.get("workspaceName", "")[:21]
-        last_visit = item.get("lastVisitedTimeUTC", "")[:10] if item.get("lastVisitedTimeUTC") else ""
         owner = item.get("ownerUser", {})
-        owner_name = f"{owner.get('givenName', '')} {owner.get('familyName', '')}"[:19]
-        lines.append(f"{name:<35} {workspace:<22} {last_visit:<12} {owner_name:<20}")
+        lines.append(row_fmt(
+            item.get("displayName", item.get("name", "Unknown"))[:34],
+            item.get("workspaceName", "")[:21],
+            (item.get("lastVisitedTimeUTC") or "")[:10],
+            f"{owner.get('givenName', '')} {owner.get('familyName', '')}"[:19],
+        ))
 
     return "\n".join(lines)
 
 
+def _json_records(items: List[Dict]) -> List[Dict]:
+    """Clean JSON output records - internal fields removed."""
+    return [
+        {
+            "name": item.get("displayName", item.get("name")),
+            "workspace": item.get("workspaceName"),
+            "workspaceId": item.get("workspaceObjectId"),
+            "id": item.get("objectId"),
+            "lastVisited": item.get("lastVisitedTimeUTC"),
+            "lastRefreshed": _get_refresh_time(item),
+            "lastModified": _get_modified_time(item),
+            "owner": item.get("ownerUser", {}).get("emailAddress"),
+            "ownerName": f"{item.get('ownerUser', {}).get('givenName', '')} {item.get('ownerUser', {}).get('familyName', '')}".strip(),
+            "storageMode": _get_storage_mode(item),
+            "capacitySku": item.get("artifact", {}).get("sharedFromEnterpriseCapacitySku"),
+            "isDiscoverable": item.get("isDiscoverable"),
+            "region": item.get("region"),
+        }
+        for item in items
+    ]
+
+
+def _format_output_bytes(items: List[Dict], output_format: str = "table") -> bytes:
+    """format_output as UTF-8 bytes; JSON goes straight to bytes without a str round-trip."""
+    if output_format == "json":
+        return _jdumps_bytes(_json_records(items))
+    return format_output(items, output_format).encode("utf-8")
+
+
+def _write_stdout(items: List[Dict], output_format: str = "table") -> None:
+    """Write formatted output plus a newline, as UTF-8 bytes straight to the stdout byte buffer when it is UTF-8."""
+    buffer = getattr(sys.stdout, "buffer", None)
+    encoding = (getattr(sys.stdout, "encoding", None) or "").lower().replace("-", "")
+    if buffer is None or encoding != "utf8":
+        # Non-UTF-8 console (or redirected/replaced stdout): go through the text
+        # layer, with format_output's ASCII-escaped JSON rather than raw orjson bytes
+        print(format_output(items, output_format))
+        return
+    sys.stdout.flush()
+    buffer.write(_format_output_bytes(items, output_format))
+    buffer.write(b"\n")
+    buffer.flush()
+
+
 def _get_storage_mode(item: Dict) -> str:
     """Get human-readable storage mode from item."""
     artifact = item.get("artifact", {})
@@ -660,32 +1271,12 @@ def _get_storage_mode(item: Dict) -> str:
 
 def _get_refresh_time(item: Dict) -> Optional[str]:
     """Get last refresh time from item as ISO string (models: lastRefreshTime, notebooks: lastUpdatedDate)."""
-    # Try top-level lastRefreshTime first (models)
-    refresh_time = item.get("lastRefreshTime")
-    if refresh_time:
-        dt = _parse_odata_date(refresh_time)
-        return dt.isoformat() if dt else None
-    # Try artifact.LastRefreshTime
-    artifact = item.get("artifact", {})
-    refresh_time = artifact.get("LastRefreshTime") or artifact.get("lastRefreshTime")
-    if refresh_time:
-        dt = _parse_odata_date(refresh_time)
-        return dt.isoformat() if dt else None
-    # Try artifact.lastUpdatedDate (notebooks)
-    updated = artifact.get("lastUpdatedDate")
-    if updated:
-        dt = _parse_odata_date(updated)
-        return dt.isoformat() if dt else None
-    return None
+    return dt.isoformat() if (dt := _get_item_refresh_datetime(item)) else None
 
 
 def _get_modified_time(item: Dict) -> Optional[str]:
     """Get last modified time from item as ISO string."""
-    modified = item.get("modifiedDate")
-    if modified:
-        dt = _parse_odata_date(modified)
-        return dt.isoformat() if dt else None
-    return None
+    return dt.isoformat() if (dt := _parse_odata_date(item.get("modifiedDate"))) else None
 
 #endregion
 
@@ -802,9 +1393,16 @@ Examples:
     # API options
     api_group = parser.add_argument_group("API Options")
     api_group.add_argument("--region", "-r", default=DEFAULT_REGION,
-                           help=f"Fabric region (default: {DEFAULT_REGION}). Use --list-regions for options.")
+                           help=f"Fabric region (default: {DEFAULT_REGION}), or '{ALL_REGIONS}' to search every "
+                                "region in parallel. Use --list-regions for options.")
     api_group.add_argument("--page-size", type=int, default=200,
                            help="Results per API call, max 1000 (default: 200)")
+    api_group.add_argument("--pages", type=int, default=1,
+                           help="Number of result pages to fetch concurrently (default: 1)")
+    api_group.add_argument("--cache-ttl", type=int, default=DEFAULT_CACHE_TTL, metavar="SECONDS",
+                           help=f"Reuse cached API responses younger than this (default: {DEFAULT_CACHE_TTL})")
+    api_group.add_argument("--no-cache", action="store_true",
+                           help="Always query the API, bypassing the response cache")
 
     # Info
     info_group = parser.add_argument_group("Information")
@@ -819,16 +1417,9 @@ Examples:
     if args.list_types:
         print("Available item types:\n")
         print("IMPORTANT: Use 'Model' for semantic models, 'DataFlow' for dataflows, 'SynapseNotebook' for notebooks\n")
-        by_category = {}
-        for name, info in ITEM_TYPES.items():
-            cat = info["category"]
-            if cat not in by_category:
-                by_category[cat] = []
-            by_category[cat].append((name, info.get("desc", "")))
-
-        for cat, types in sorted(by_category.items()):
+        for cat, types in _ITEM_TYPES_BY_CATEGORY:
             print(f"  {cat}:")
-            for name, desc in sorted(types):
+            for name, desc in types:
                 print(f"    {name:<30} {desc}")
             print()
         return 0
@@ -836,7 +1427,7 @@ Examples:
     # List regions
     if args.list_regions:
         print("Available regions:\n")
-        for region, host in sorted(REGIONS.items()):
+        for region, host in _SORTED_REGIONS:
             default = " (default)" if region == DEFAULT_REGION else ""
             print(f"  {region:<20} {host}{default}")
         return 0
@@ -856,21 +1447,43 @@ Examples:
     if not token:
         return 1
 
-    # Search
-    print(f"Searching for {args.item_type} in {args.region}...", file=sys.stderr)
-    result = search_datahub(
-        token=token,
-        item_types=[args.item_type],
-        region=args.region,
-        workspace_id=args.workspace_id,
-        page_size=args.page_size
+    # Without client-side filters or sorting, --limit is simply the first N results,
+    # so request no more than that
+    page_size, pages = args.page_size, args.pages
+    client_side = (
+        args.filter_text, args.workspace_filter, args.owner,
+        args.visited_since, args.not_visited_since,
+        args.refreshed_since, args.not_refreshed_since,
+        args.updated_since, args.not_updated_since,
+        args.storage_mode, args.capacity_sku, args.sort,
     )
+    if args.limit and not any(client_side):
+        page_size = min(page_size, args.limit)
+        pages = min(pages, -(-args.limit // page_size))
+
+    # Search
+    _parse_iso_date.cache_clear()
+    _parse_odata_date.cache_clear()
+    search_options = {
+        "pages": pages,
+        "workspace_id": args.workspace_id,
+        "page_size": page_size,
+        "cache_ttl": 0 if args.no_cache else args.cache_ttl,
+    }
+    if args.region == ALL_REGIONS:
+        print(f"Searching for {args.item_type} in all {len(REGIONS)} regions...", file=sys.stderr)
+        result = search_all_regions(token, [args.item_type], **search_options)
+    else:
+        print(f"Searching for {args.item_type} in {args.region}...", file=sys.stderr)
+        result = search_datahub_many(token, [args.item_type], [args.region], **search_options)
 
     if not result["success"]:
-        print(f"Error: {result['error']}", file=sys.stderr)
+        print(f"Error: {'; '.join(result['errors'])}", file=sys.stderr)
         return 1
+    for error in result["errors"]:
+        print(f"Warning: {error}", file=sys.stderr)
 
-    items = result["items"]
+    items = _prepare(result["items"])
     print(f"API returned {len(items)} items", file=sys.stderr)
 
     # Apply filters
@@ -899,7 +1512,7 @@ Examples:
 
     # Output
     print(f"\nFound {len(items)} items after filtering:\n", file=sys.stderr)
-    print(format_output(items, args.output))
+    _write_stdout(items, args.output)
 
     return 0
 